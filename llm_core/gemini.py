@@ -1,5 +1,6 @@
 
 import time
+import threading
 from dotenv import load_dotenv
 import os
 
@@ -22,6 +23,29 @@ model_name = "gemini-2.0-flash-001"
 client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
 # .env에 넣고, gitignore에 .env 추가하고, 주석해재한다음에 사용
 
+# 분당 요청 한도 토큰 버킷 (한도 안에서는 바로 호출, 초과할 때만 다음 토큰이 채워질 때까지 대기)
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", "60"))
+GEMINI_BURST = 5
+_bucket_lock = threading.Lock()
+_bucket_tokens = float(GEMINI_BURST)
+_bucket_updated = time.monotonic()
+
+
+def _acquire_token():
+    """토큰 버킷에서 요청 토큰 하나를 가져오고, 없으면 다음 토큰이 채워질 때까지 대기"""
+    global _bucket_tokens, _bucket_updated
+    rate = GEMINI_RPM / 60.0
+    while True:
+        with _bucket_lock:
+            now = time.monotonic()
+            _bucket_tokens = min(GEMINI_BURST, _bucket_tokens + (now - _bucket_updated) * rate)
+            _bucket_updated = now
+            if _bucket_tokens >= 1:
+                _bucket_tokens -= 1
+                return
+            wait = (1 - _bucket_tokens) / rate
+        time.sleep(wait)
+
 
 # doc_url_1 = "https://arxiv.org/pdf/1706.03762"
 # # doc_url_2 = "https://arxiv.org/pdf/2403.05530"
@@ -54,6 +78,7 @@ def ask_question_to_gemini_cache(prompt, attachments=None, max_retries=5, retry_
     for attempt in range(max_retries):
         try:
             print(f"attempt {attempt} starting at {time.time() - start_time:.2f}s")
+            _acquire_token()
             api_start = time.time()
             response = client.models.generate_content(
                 model=model_name,
@@ -85,6 +110,52 @@ def ask_question_to_gemini_cache(prompt, attachments=None, max_retries=5, retry_
     return None
 
 
+def ask_question_to_gemini_stream(prompt, attachments=None, max_retries=5, retry_delay=5):
+    """
+    Streaming version of ask_question_to_gemini_cache.
+    Yields text chunks as they arrive so callers can start parsing before generation ends.
+    Retries only while no chunk has been yielded yet.
+    """
+    start_time = time.time()
+    if attachments:
+        prompt = [prompt]
+        for pdf in attachments:
+            prompt.append(pdf)
+    else: 
+        prompt += "NO ATTACHMENTS PROVIDED."
+    for attempt in range(max_retries):
+        started = False
+        try:
+            print(f"stream attempt {attempt} starting at {time.time() - start_time:.2f}s")
+            _acquire_token()
+            for chunk in client.models.generate_content_stream(
+                model=model_name,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.3
+                )
+            ):
+                if chunk.text:
+                    if not started:
+                        print(f"First chunk after {time.time() - start_time:.2f}s")
+                        started = True
+                    yield chunk.text
+            print(f"Total time for streamed response: {time.time() - start_time:.2f}s")
+            return
+        except genai.errors.ServerError as e:
+            if e.code == 503 and not started:
+                print(f"Rate limit exceeded (attempt {attempt + 1}/{max_retries}) at {time.time() - start_time:.2f}s. Retrying in {retry_delay} seconds...")
+                time.sleep(retry_delay)
+            else:
+                print(f"Gemini API error (attempt {attempt + 1}/{max_retries}) at {time.time() - start_time:.2f}s: {e}")
+                raise
+        except Exception as e:
+            print(f"Unexpected error (attempt {attempt + 1}/{max_retries}) at {time.time() - start_time:.2f}s: {e}")
+            raise
+
+    print(f"Failed after {max_retries} attempts. Total time: {time.time() - start_time:.2f}s")
+
+
 def json_match(input_string):
     """
     Use regex to extract JSON from a string.
@@ -109,4 +180,5 @@ def json_match(input_string):
     return None
 
 
-print(json_match(ask_question_to_gemini_cache("How do transformers work?", attachments=attachments)))
\ No newline at end of file
+if __name__ == "__main__":
+    print(json_match(ask_question_to_gemini_cache("How do transformers work?", attachments=attachments)))
@@ -46,13 +46,11 @@ def classify_llm(article: str):
     
     return answer_dict['category']
 
-def policy_llm(article: str):
-    
+def build_policy_prompt(article: str):
     """
-    정책 관련 기사에서 수혜/피해 category 분석
+    policy_llm / policy_llm_stream 공용 프롬프트 생성
     """
-    
-    prompt = """
+    return """
 너는 기사 분석 전문가이자 산업 분석가야.  
 너의 임무는 주어진 기사 내용을 바탕으로,  
 해당 정책이 어떤 업종(산업 분야)에 수혜를 줄 수 있고,  
@@ -97,12 +95,99 @@ def policy_llm(article: str):
 ### 기사: 
 {}
     """.format(article)
+
+
+def policy_llm(article: str):
+    
+    """
+    정책 관련 기사에서 수혜/피해 category 분석
+    """
+    
+    prompt = build_policy_prompt(article)
     answer = ask_question_to_gemini_cache(prompt)
     json_dict = json_match(answer)
     print(f"policy_llm answer: {json_dict}")
     return json_dict['positive']
 
 
+def _find_object_end(text: str, start: int):
+    """
+    text[start] == '{' 인 객체의 닫는 괄호 위치 반환 (문자열 내부 괄호 무시), 아직 닫히지 않았으면 -1
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def policy_llm_stream(article: str):
+    """
+    policy_llm 스트리밍 버전 - "positive" 배열의 업종이 완성되는 즉시 하나씩 yield
+    (뒤쪽 업종이 생성되는 동안 앞 업종의 competitive_llm 분석을 먼저 시작할 수 있음)
+    """
+    prompt = build_policy_prompt(article)
+    stream = ask_question_to_gemini_stream(prompt)
+    buffer = ""
+    pos = -1  # "positive" 배열 내부의 다음 스캔 위치
+    yielded = 0
+    malformed = False
+    for chunk in stream:
+        buffer += chunk
+        if pos == -1:
+            key = buffer.find('"positive"')
+            bracket = buffer.find('[', key) if key != -1 else -1
+            if bracket == -1:
+                continue
+            pos = bracket + 1
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                print(f"policy_llm_stream answer: {buffer}")
+                return
+            if buffer[pos] != '{':
+                malformed = True
+                break
+            end = _find_object_end(buffer, pos)
+            if end == -1:
+                break
+            try:
+                item = json.loads(buffer[pos:end + 1])
+            except json.JSONDecodeError:
+                malformed = True
+                break
+            yield item
+            yielded += 1
+            pos = end + 1
+        if malformed:
+            break
+
+    # 형식이 예상과 다르면 나머지 응답을 모두 받은 뒤 일반 파싱으로 처리
+    buffer += "".join(stream)
+    json_dict = json_match(buffer) or {}
+    print(f"policy_llm_stream answer: {json_dict}")
+    yield from json_dict.get('positive', [])[yielded:]
+
+
 def competitive_llm(category: str, reason: str, article: str):
     prompt = """
 너는 산업 분석 전문가이자 국내 상장기업 분석에 특화된 리서치 애널리스트야.
@@ -4,6 +4,8 @@ import time
 import csv
 import os
 import kis
+import re
+from itertools import islice
 
 def load_stock_codes():
     """
@@ -13,7 +15,7 @@ def load_stock_codes():
     csv_path = os.path.join(current_dir, 'stock_list.csv')
     
     stock_dict = {}
-    with open(csv_path, 'r', encoding='utf-8') as f:
+    with open(csv_path, 'r', encoding='utf-8-sig') as f:
         for line in f:
             if line.startswith('code'): # 헤더 스킵
                 continue
@@ -21,6 +23,25 @@ def load_stock_codes():
             stock_dict[name] = code
     return stock_dict
 
+def build_stock_pattern(stock_codes: dict):
+    """
+    종목명 전체를 하나의 정규식으로 컴파일 (긴 이름 우선 매칭: SK하이닉스 > SK)
+    """
+    names = sorted(stock_codes, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, names)))
+
+def find_listed_companies(text: str, stock_pattern) -> set:
+    """
+    텍스트를 한 번만 스캔하여 언급된 상장 종목명 집합 반환
+    """
+    return set(stock_pattern.findall(text))
+
+def articles_to_text(articles) -> str:
+    """
+    crawl_naver_news_by_keyword 결과(NewsItem 리스트)의 제목/요약을 하나의 텍스트로 결합
+    """
+    return "\n".join(f"{item.title} {item.description}" for item in articles)
+
 def llm_test(article: str = None, json_data: dict = None):
     """
     LLM 테스트 함수 - 기존 기사 분석 또는 JSON 데이터 분석
@@ -34,6 +55,7 @@ def llm_test(article: str = None, json_data: dict = None):
 
         # 종목코드 딕셔너리 로드
         stock_codes = load_stock_codes()
+        stock_pattern = build_stock_pattern(stock_codes)
         buy_stocks = []  # 매수할 종목 리스트
 
         # 뉴스 데이터에서 기사들 추출
@@ -83,39 +105,44 @@ def llm_test(article: str = None, json_data: dict = None):
                             print(f"   📄 이유: {company_result.get('reason', '')}")
 
                 elif category == "정책 기사":
-                    positives = policy_llm(article_text)
-
-                    if positives:
-                        print(f"   📊 긍정적 업종 {len(positives)}개 발견")
-
-                        # 정책 기사에서 긍정적인 업종 추출 후 각 업종 심층 분석
-                        for policy_category in positives[:2]:  # 최대 2개 업종만 분석
-                            category_name = policy_category.get('category', '')
-                            category_reason = policy_category.get('reason', '')
-
-                            print(f"   🔍 {category_name} 업종 분석 중...")
-
-                            try:
-                                # 해당 업종 관련 뉴스 크롤링
-                                sector_articles = crawl_naver_news_by_keyword(category_name, page=1, sort=1)
-                                comp_result = competitive_llm(category_name, category_reason, sector_articles)
-
-                                companies = comp_result.get('companies', [])
-                                for company in companies:
-                                    company_name = company.get('company')
-                                    if company_name in stock_codes:
-                                        print(f"   ✅ 업종: {category_name}, 기업: {company_name}")
-                                        print(f"   📈 종목코드: {stock_codes[company_name]}")
-                                        print(f"   📄 이유: {company.get('reason', '')}")
-
-                                        # 중복 체크 후 매수 리스트에 추가
-                                        if stock_codes[company_name] not in buy_stocks:
-                                            buy_stocks.append(stock_codes[company_name])
-                                    else:
-                                        print(f"   ⚠️ 업종: {category_name}, 기업: {company_name}, 종목코드: 미상장")
-                            except Exception as e:
-                                print(f"   ❌ {category_name} 업종 분석 실패: {e}")
-                    else:
+                    found = 0
+
+                    # 정책 기사에서 긍정적인 업종이 스트리밍되는 즉시 각 업종 심층 분석
+                    for policy_category in islice(policy_llm_stream(article_text), 2):  # 최대 2개 업종만 분석
+                        found += 1
+                        category_name = policy_category.get('category', '')
+                        category_reason = policy_category.get('reason', '')
+
+                        print(f"   🔍 {category_name} 업종 분석 중...")
+
+                        try:
+                            # 해당 업종 관련 뉴스 크롤링
+                            sector_articles = crawl_naver_news_by_keyword(category_name, page=1, sort=1)
+
+                            # 크롤링 기사에 상장 종목이 하나도 없으면 LLM 호출 생략
+                            if not find_listed_companies(articles_to_text(sector_articles), stock_pattern):
+                                print(f"   ℹ️ {category_name}: 크롤링 기사에 상장 종목 언급 없음 - 분석 생략")
+                                continue
+
+                            comp_result = competitive_llm(category_name, category_reason, sector_articles)
+
+                            companies = comp_result.get('companies', [])
+                            for company in companies:
+                                company_name = company.get('company')
+                                if company_name in stock_codes:
+                                    print(f"   ✅ 업종: {category_name}, 기업: {company_name}")
+                                    print(f"   📈 종목코드: {stock_codes[company_name]}")
+                                    print(f"   📄 이유: {company.get('reason', '')}")
+
+                                    # 중복 체크 후 매수 리스트에 추가
+                                    if stock_codes[company_name] not in buy_stocks:
+                                        buy_stocks.append(stock_codes[company_name])
+                                else:
+                                    print(f"   ⚠️ 업종: {category_name}, 기업: {company_name}, 종목코드: 미상장")
+                        except Exception as e:
+                            print(f"   ❌ {category_name} 업종 분석 실패: {e}")
+
+                    if not found:
                         print(f"   ℹ️ 긍정적 업종이 발견되지 않았습니다.")
 
                 else:
@@ -167,6 +194,7 @@ def llm_test(article: str = None, json_data: dict = None):
     
     # 종목코드 딕셔너리 로드
     stock_codes = load_stock_codes()
+    stock_pattern = build_stock_pattern(stock_codes)
     buy_stocks = []  # 매수할 종목 리스트
 
     if category == "경제 기사":
@@ -184,11 +212,12 @@ def llm_test(article: str = None, json_data: dict = None):
                 print(f"기업: {company_name}, 종목코드: 미상장, 이유: {company_result.get('reason', '')}")
 
     elif category == "정책 기사":
-        positives = policy_llm(article)
-        
-        # 정책 기사에서 긍정적인 업종 추출 후 각 업종 심층 분석 -> �� 호재 업종 마다 competitive_llm 호출
-        for category in positives:
+        # 정책 기사에서 긍정적인 업종이 스트리밍되는 즉시 각 업종 심층 분석 -> 각 호재 업종 마다 competitive_llm 호출
+        for category in policy_llm_stream(article):
             article = crawl_naver_news_by_keyword(category['category'], page=1, sort=1)
+            if not find_listed_companies(articles_to_text(article), stock_pattern):
+                print(f"업종: {category['category']}, 크롤링 기사에 상장 종목 언급 없음 - 분석 생략")
+                continue
             comp_result = competitive_llm(category['category'], category['reason'], article)
             companies = comp_result.get('companies', [])
             for company in companies:
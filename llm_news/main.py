@@ -13,6 +13,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from news_analyzer import IntegratedNewsAnalyzer
 
+# 실행/완료 시간 출력 형식
+TIME_FORMAT = '%Y년 %m월 %d일 %H시 %M분'
+
 def call_llm_test_with_json(json_file_path):
     """
     생성된 JSON 파일을 llm_core의 test.py에 전달하여 실행
@@ -59,7 +62,7 @@ def main():
     print("=" * 80)
     print("🚀 통합 뉴스 & 리서치 크롤링 및 분석 시스템")
     print("=" * 80)
-    print(f"📅 실행 시간: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}")
+    print(f"📅 실행 시간: {datetime.now().strftime(TIME_FORMAT)}")
     print()
 
     # 통합 분석기 인스턴스 생성
@@ -133,7 +136,7 @@ def main():
                 # llm_core/test.py 자동 실행
                 call_llm_test_with_json(json_file_path)
 
-            print(f"\n⏰ 완료 시간: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}")
+            print(f"\n⏰ 완료 시간: {datetime.now().strftime(TIME_FORMAT)}")
 
         else:
             print("❌ 크롤링 또는 분석 실패")
@@ -4,13 +4,24 @@
 
 from typing import List, Dict
 import json
+import orjson
 import logging
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 import time
 import re
 import os
+import hashlib
+import io
+import copy
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import defaultdict
+from itertools import islice
 from dotenv import load_dotenv
 
 # 환경 변수 로드
@@ -19,52 +30,396 @@ load_dotenv()
 from google import genai
 from google.genai import types
 
+# 크롤러와 같은 토큰 버킷/XPath 클래스 조건식/파일 캐시 정리 사용
+from news_crawler import _TokenBucket, _css_class, _prune_cache_dir
+
 # 로��� 설정
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# 기사/리포트 본문 동시 크롤링 스레드 수
+CRAWL_WORKERS = 8
+
+# 파싱 범위 제한용 SoupStrainer
+_TABLE_STRAINER = SoupStrainer('table')
+
+# 헤드라인 링크 후보 선택자 (우선순위 순 - 헤드라인 → 최신 → 일반 제목 → 모든 기사 링크)
+_HEADLINE_SELECTORS = (
+    '.section_headline .sa_text_title',
+    '.section_latest .sa_text_title',
+    '.sa_text_title',
+    'a[href*="/article/"]',
+)
+
+# 기사/리포트 상세 페이지에서 읽을 최대 바이트 수 (본문은 이 범위 안에 위치)
+MAX_PAGE_BYTES = 256 * 1024
+
+# Gemini 응답 캐시에 보관할 최대 응답 수
+LLM_CACHE_MAX_ENTRIES = 500
+
+# 목록 페이지 요약(.sa_text_lede)이 이 길이 이상이면 기사 본문 크롤링을 생략
+SNIPPET_MIN_LENGTH = 120
+
+# 분석 종류별 Gemini 서비스 티어
+# 뉴스 감정은 결과를 바로 보여주므로 standard, 리서치 리포트 요약은 급하지 않으므로 flex(50% 할인)
+ANALYSIS_TIERS = {
+    'news': 'standard',
+    'reports': 'flex',
+}
+
+# 리서치 리포트 분석 결과의 필수 항목과 누락 시 채울 기본값
+_REPORTS_REQUIRED_DEFAULTS = {
+    'category_summary': {"종목분석": "분석 데이터 부족", "산업분석": "분석 데이터 부족", "시황정보": "분석 데이터 부족", "투자정보": "분석 데이터 부족"},
+    'top_mentioned_stocks': ["데이터 부족"],
+    'key_industries': ["데이터 부족"],
+    'investment_themes': ["데이터 부족"],
+    'market_outlook': "neutral",
+    'risk_factors': ["데이터 부족"],
+    'opportunities': ["데이터 부족"],
+    'analyst_consensus': "분석 데이터가 부족합니다.",
+    'summary': "분석 데이터가 부족합니다.",
+}
+
+# 리포트 카테고리 → 분석 텍스트에 표시할 이름
+_CATEGORY_NAMES = {
+    'stock_analysis': '종목분석 리포트',
+    'industry_analysis': '산업분석 리포트',
+    'market_info': '시황정보 리포트',
+    'investment_info': '투자정보 리포트',
+    '종목분석': '종목분석 리포트',
+    '산업분석': '산업분석 리포트',
+    '시황정보': '시황정보 리포트',
+    '투자정보': '투자정보 리포트'
+}
+
+
+# 분석 프롬프트의 고정 앞부분 (지시문 + JSON 스키마)
+# 모듈 로드 시 한 번만 만들어 두고 모든 호출이 바이트 단위로 같은 접두어를 쓰도록 함 (암묵적 프롬프트 캐시 적중 조건)
+_NEWS_ANALYSIS_PROMPT_PREFIX = """
+다음 뉴스들을 분석하여 JSON 형태로 결과를 제공해주세요.
+
+분석 결과를 다음 JSON 형식으로 정확히 제공해주세요:
+
+{
+  "overall_sentiment": "positive/negative/neutral",
+  "sentiment_score": 0-100,
+  "key_themes": ["주요 테마1", "주요 테마2"],
+  "market_impact": "시장에 미치는 영향 분석",
+  "summary": "전체 뉴스 요약",
+  "investment_signals": "buy/sell/hold"
+}
+
+=== 분석할 뉴스 ===
+"""
+
+_REPORTS_ANALYSIS_PROMPT_PREFIX = """
+다음 리서치 리포트들을 분석하여 JSON 형태로 결과를 제공해주세요.
+
+분석 결과를 다음 JSON 형식으로 정확히 제공해주세요:
+
+{
+  "category_summary": {
+    "종목분석": "종목분석 요약",
+    "산업분석": "산업분석 요약", 
+    "시황정보": "시황정보 요약",
+    "투자정보": "투자정보 요약"
+  },
+  "top_mentioned_stocks": ["종목1", "종목2", "종목3"],
+  "key_industries": ["업종1", "업종2", "업종3"],
+  "investment_themes": ["투자테마1", "투자테마2"],
+  "market_outlook": "positive/negative/neutral",
+  "risk_factors": ["리스크1", "리스크2"],
+  "opportunities": ["기회1", "기회2"],
+  "analyst_consensus": "애널리스트 consensus",
+  "summary": "전체 리포트 종합 요약"
+}
+
+=== 분석할 리서치 리포트 ===
+"""
+
+
+def _summarize(content: str) -> str:
+    """본문 첫 문장을 최대 200자까지 잘라 요약으로 사용"""
+    if not content:
+        return ''
+    # 첫 문장만 필요하므로 split 대신 find로 첫 마침표 위치만 확인
+    dot = content.find('.')
+    first = content if dot < 0 else content[:dot]
+    return first[:200] + ('...' if len(first) > 200 else '')
+
+
+# 본문 추출 실패 시 들어오는 요약 자리표시 문구
+_EMPTY_SUMMARY = "요약 내용을 찾을 수 없습니다."
+
+
+@lru_cache(maxsize=64)
+def _format_reports_text(reports_key: tuple) -> str:
+    """
+    (카테고리, ((제목, 증권사, 요약, 날짜), ...)) 튜플을 분석용 텍스트로 변환 (같은 입력은 캐시 재사용)
+    """
+    buf = io.StringIO()
+
+    for category, reports in reports_key:
+        if reports:
+            display_name = _CATEGORY_NAMES.get(category, category)
+            buf.write(f"\n\n=== {display_name} ===\n")
+
+            for idx, (title, provider, summary, publish_date) in enumerate(reports, 1):
+                provider_line = f"   증권사: {provider}\n" if provider else ""
+
+                # summary가 비어있으면 제목으로 대체
+                # 공백만 있는 요약도 비어있는 것으로 간주
+                if summary and not summary.isspace() and summary != _EMPTY_SUMMARY:
+                    summary_line = f"   요약: {summary[:200]}...\n"
+                else:
+                    summary_line = f"   요약: 제목 참조\n"
+
+                date_line = f"   날짜: {publish_date}\n" if publish_date else ""
+
+                # 리포트 하나당 한 번만 write
+                buf.write(f"\n{idx}. 제목: {title}\n{provider_line}{summary_line}{date_line}")
+
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=64)
+def _compute_category_insights(reports_key: tuple) -> tuple:
+    """
+    ((카테고리, 증권사, 제목), ...) 튜플로 카테고리별 통계와 최다 카테고리 계산 (같은 입력은 캐시 재사용)
+    반환값은 캐시와 공유되므로 호출 측(_generate_category_insights)에서 복사본을 만들어 반환
+    """
+    # 카테고리별 통계 (처음 보는 카테고리는 defaultdict가 생성, 건수도 같은 항목에 집계해 행당 조회 한 번)
+    category_stats = defaultdict(lambda: {'count': 0, 'firms': set(), 'stocks': set(), 'recent_titles': []})
+    for category, provider, title in reports_key:
+        stats = category_stats[category]
+        stats['count'] += 1
+
+        if provider:
+            stats['firms'].add(provider)
+
+        # 샘플 제목은 3개만 쓰므로 그 이상은 보관하지 않음
+        if title and len(stats['recent_titles']) < 3:
+            stats['recent_titles'].append(title)
+
+    # 통계를 JSON 직렬화 가능한 형태로 변환
+    formatted_stats = {
+        category: {
+            'count': stats['count'],
+            'active_firms': list(islice(stats['firms'], 5)),  # 최대 5개 (집합 전체를 리스트로 복사하지 않음)
+            'mentioned_stocks': list(islice(stats['stocks'], 10)),  # 최대 10개
+            'sample_titles': stats['recent_titles'][:3]  # 최대 3개
+        }
+        for category, stats in category_stats.items()
+    }
+
+    # 최다 카테고리 (동률이면 먼저 등장한 카테고리, 카테고리 수만큼만 순회)
+    most_active_category = max(category_stats, key=lambda category: category_stats[category]['count'], default=None)
+
+    return formatted_stats, most_active_category
+
+
+# 네이버 뉴스 기사 페이지용 XPath (모듈 로드 시 한 번만 컴파일)
+_XP_NEWS_TITLE = etree.XPath('//*[@id="title_area"]/span')
+_XP_NEWS_DATE = etree.XPath(
+    f'//*[@id="ct"]/div[{_css_class("media_end_head")} and {_css_class("go_trans")}]'
+    f'/div[{_css_class("media_end_head_info")} and {_css_class("nv_notrans")}]'
+    f'/div[{_css_class("media_end_head_info_datestamp")}]/*[1][self::div]/span'
+)
+_XP_NEWS_DATE_FALLBACKS = [
+    etree.XPath(f'//*[{_css_class("media_end_head_info_datestamp_time")}]'),
+    etree.XPath('//span[@data-date-time]'),
+    etree.XPath(f'//*[{_css_class("author")}]//em'),
+]
+_XP_NEWS_MAIN = etree.XPath('//*[@id="dic_area"]')
+# 본문 텍스트 노드 중 script/style/iframe 및 네이버 뉴스 특화 불필요 요소 안의 것은 한 번에 제외
+_XP_NEWS_MAIN_TEXT = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::iframe'
+    f' or ancestor::*[{_css_class("end_photo_org")} or {_css_class("media_end_head_journalist")} or {_css_class("media_end_summary")}])]'
+)
+_XP_NEWS_CONTENT_FALLBACKS = [
+    etree.XPath('//*[@id="articleBodyContents"]'),
+    etree.XPath(f'//*[{_css_class("go_trans")} and {_css_class("_article_content")}]'),
+    etree.XPath(f'//*[{_css_class("_article_body_contents")}]'),
+]
+_XP_NEWS_MEDIA = [
+    etree.XPath(f'//*[{_css_class("media_end_head_top_logo")}]//img'),
+    etree.XPath(f'//*[{_css_class("press_logo")}]//img'),
+    etree.XPath(f'//*[{_css_class("media_end_head_top_logo_text")}]'),
+]
+
+# 자주 쓰는 정규식 (모듈 로드 시 한 번만 컴파일)
+_JSON_OBJ_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+# 본문 끝의 저작권 문구들 (가장 먼저 나오는 위치에서 한 번에 잘라냄)
+_UNWANTED_PHRASE_RE = re.compile('|'.join(map(re.escape, (
+    "무단전재 및 재배포 금지",
+    "저작권자",
+    "ⓒ",
+    "Copyright",
+))))
+# 날짜 형식들을 하나의 alternation으로 합쳐 텍스트를 한 번만 스캔
+_DATE_COMBINED = re.compile('|'.join(f'(?:{p})' for p in (
+    r'\d{4}[-./]\d{1,2}[-./]\d{1,2}',
+    r'\d{1,2}[-./]\d{1,2}[-./]\d{2,4}',
+    r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
+    r'\d{2}\.\d{2}\.\d{2}',
+    r'\d{4}\.\d{2}\.\d{2}',
+)))
+
+def _iter_json_objects(text: str):
+    """
+    텍스트 안의 균형 잡힌 최상위 {...} 구간을 앞에서부터 순서대로 반환 (문자열 내부 괄호 무시)
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            # 객체 바깥의 따옴표(일반 문장)는 무시
+            in_string = depth > 0
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
 class IntegratedNewsAnalyzer:
     """통합 뉴스 및 리서치 크롤링 & 분석기"""
 
     def __init__(self):
         self.model_name = "gemini-2.0-flash-001"
-        self.client = genai.Client(api_key=os.getenv("GOOGLE_AI_API_KEY"))
+
+        # API 키 확인 (재시도 루프마다 확인하지 않고 생성 시 한 번만)
+        api_key = os.getenv("GOOGLE_AI_API_KEY")
+        if not api_key:
+            raise Exception("GOOGLE_AI_API_KEY 환경 변수가 설정되지 않았습니다.")
+
+        self.client = genai.Client(api_key=api_key)
+        self._gen_config = types.GenerateContentConfig(
+            temperature=0.3,
+            max_output_tokens=2048
+        )
+        # 서비스 티어별 생성 설정 (standard: 기본, flex: 50% 할인/비긴급 작업)
+        self._gen_configs = {
+            'standard': self._gen_config,
+            'flex': self._gen_config.model_copy(update={'service_tier': types.ServiceTier.FLEX}),
+        }
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # HTTP/2 멀티플렉싱: 크롤링 스레드들이 호스트별 연결 하나를 공유
+        self.session = httpx.Client(
+            http2=True,
+            headers=self.headers,
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+
+        # 서버 부하 방지: 모든 크롤링 스레드가 공유하는 토큰 버킷 (초당 2개, 최대 4개 누적)
+        self._rate_limiter = _TokenBucket(rate=2.0, burst=4)
+
+        # 동일 프롬프트(=동일 크롤링 내용) 재실행 시 Gemini 호출을 건너뛰기 위한 응답 캐시
+        self.response_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.llm_cache')
+        self.response_cache_ttl = 1800  # 초
+        # TTL이 지난 응답은 다시 쓰이지 않으므로 시작 시 삭제
+        _prune_cache_dir(self.response_cache_dir, self.response_cache_ttl, LLM_CACHE_MAX_ENTRIES)
+
+    def _fetch_bounded(self, url: str, max_bytes: int = MAX_PAGE_BYTES) -> bytes:
+        """응답 본문을 스트리밍으로 받아 앞부분 max_bytes만 반환 (워커당 메모리 상한 고정)"""
+        with self.session.stream('GET', url) as response:
+            response.raise_for_status()
+            chunks = []
+            size = 0
+            for chunk in response.iter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes:
+                    break
+        return b"".join(chunks)[:max_bytes]
+
+    def _response_cache_path(self, prompt: str) -> str:
+        """프롬프트 내용 해시로 캐시 파일 경로 생성"""
+        key = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return os.path.join(self.response_cache_dir, f"{key}.json")
+
+    def _get_cached_response(self, prompt: str):
+        """TTL 이내에 저장된 동일 프롬프트의 응답 반환 (없으면 None)"""
+        path = self._response_cache_path(prompt)
+        try:
+            if time.time() - os.path.getmtime(path) > self.response_cache_ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                response = json.load(f)['response']
+            logger.info("♻️ 응답 캐시 적중 - Gemini 호출 생략")
+            return response
+        except (OSError, ValueError, KeyError):
+            return None
 
-    def ask_question_to_gemini_cache(self, prompt, max_retries=5, retry_delay=5):
+    def _set_cached_response(self, prompt: str, response: str):
+        """Gemini 응답을 캐시에 저장"""
+        if not response:
+            return
+        try:
+            os.makedirs(self.response_cache_dir, exist_ok=True)
+            with open(self._response_cache_path(prompt), 'w', encoding='utf-8') as f:
+                json.dump({'response': response}, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"응답 캐시 저장 실패: {e}")
+
+    def _tier_fallback(self, e, tier: str) -> str:
+        """flex 티어가 용량·할당량 부족(429/503)으로 거절되면 standard 티어로 전환"""
+        if tier != 'standard' and getattr(e, 'code', None) in (429, 503):
+            logger.warning(f"{tier} 티어 요청 거절 ({e.code}) - standard 티어로 재시도")
+            return 'standard'
+        return tier
+
+    def ask_question_to_gemini_cache(self, prompt, max_retries=5, retry_delay=5, tier='standard'):
         """
         Gemini API를 사용하여 질문에 대한 답변을 얻습니다.
         뉴스 분석에 최적화된 버전입니다.
+        tier: 서비스 티어 ('standard', 'flex'), flex가 거절되면 standard로 대체
         """
+        cached = self._get_cached_response(prompt)
+        if cached is not None:
+            return cached
+
         start_time = time.time()
 
         for attempt in range(max_retries):
             try:
-                # API 키 확인
-                api_key = os.getenv("GOOGLE_AI_API_KEY")
-                if not api_key:
-                    raise Exception("GOOGLE_AI_API_KEY 환경 변수가 설정되지 않았습니다.")
-
                 # Gemini API 호출
                 response = self.client.models.generate_content(
                     model=self.model_name,
                     contents=prompt,
-                    config=types.GenerateContentConfig(
-                        temperature=0.3,
-                        max_output_tokens=2048
-                    )
+                    config=self._gen_configs[tier]
                 )
 
+                self._log_cache_usage(response)
+                self._set_cached_response(prompt, response.text)
                 return response.text
 
             except Exception as e:
                 error_msg = str(e).lower()
                 print(f"API 오류 (시도 {attempt + 1}/{max_retries}): {e}")
 
+                fallback_tier = self._tier_fallback(e, tier)
+                if fallback_tier != tier:
+                    tier = fallback_tier
+                    continue
+
                 if hasattr(e, 'code') and e.code == 503:
                     print(f"⏳ API 사용량 한도 초과 (시도 {attempt + 1}/{max_retries}). {retry_delay}초 후 재시도...")
                     time.sleep(retry_delay)
@@ -77,28 +432,157 @@ class IntegratedNewsAnalyzer:
 
         return "모든 재시도 실패"
 
+    async def ask_question_to_gemini_async(self, prompt, max_retries=5, retry_delay=5, tier='standard'):
+        """
+        ask_question_to_gemini_cache의 비동기 버전 (여러 프롬프트를 동시에 요청할 때 사용)
+        """
+        cached = self._get_cached_response(prompt)
+        if cached is not None:
+            return cached
+
+        for attempt in range(max_retries):
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=self._gen_configs[tier]
+                )
+
+                self._log_cache_usage(response)
+                self._set_cached_response(prompt, response.text)
+                return response.text
+
+            except Exception as e:
+                print(f"API 오류 (시도 {attempt + 1}/{max_retries}): {e}")
+
+                fallback_tier = self._tier_fallback(e, tier)
+                if fallback_tier != tier:
+                    tier = fallback_tier
+                    continue
+
+                if attempt == max_retries - 1:
+                    return f"API 호출 실패: {e}"
+
+                await asyncio.sleep(retry_delay)
+
+        return "모든 재시도 실패"
+
+    async def ask_questions_to_gemini_async(self, prompts: Dict[str, str], tiers: Dict[str, str] = None) -> Dict[str, str]:
+        """
+        여러 프롬프트를 동시에 요청하고 결과를 키별로 반환합니다.
+
+        Args:
+            prompts: {키: 프롬프트}
+            tiers: {키: 서비스 티어}, 없는 키는 standard
+
+        Returns:
+            Dict[str, str]: {키: 응답 텍스트}
+        """
+        tiers = tiers or {}
+        keys = list(prompts)
+        answers = await asyncio.gather(*(
+            self.ask_question_to_gemini_async(prompts[key], tier=tiers.get(key, 'standard')) for key in keys
+        ))
+        return dict(zip(keys, answers))
+
+    def ask_questions_to_gemini_batch(self, prompts: Dict[str, str], poll_interval: int = 30, timeout: int = 3600) -> Dict[str, str]:
+        """
+        여러 프롬프트를 Gemini Batch API 작업 하나로 제출하고 결과를 키별로 반환합니다.
+        (동기 호출 대비 50% 비용, 지연시간이 중요하지 않은 정기 실행용)
+
+        Args:
+            prompts: {키: 프롬프트}
+            poll_interval: 작업 상태 확인 간격(초)
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            Dict[str, str]: {키: 응답 텍스트}, 실패한 항목은 None
+        """
+        # 캐시에 있는 프롬프트는 배치 작업에서 제외
+        results = {key: self._get_cached_response(prompt) for key, prompt in prompts.items()}
+        keys = [key for key, cached in results.items() if cached is None]
+        if not keys:
+            return results
+
+        try:
+            inline_requests = [
+                {
+                    'contents': [{'parts': [{'text': prompts[key]}], 'role': 'user'}],
+                    'config': {'temperature': 0.3, 'max_output_tokens': 2048}
+                }
+                for key in keys
+            ]
+            batch_job = self.client.batches.create(
+                model=self.model_name,
+                src=inline_requests,
+                config={'display_name': f"integrated-analysis-{datetime.now().strftime('%Y%m%d_%H%M%S')}"}
+            )
+            logger.info(f"📦 Gemini 배치 작업 제출: {batch_job.name} ({len(keys)}건)")
+
+            finished_states = {'JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED'}
+            deadline = time.monotonic() + timeout
+            while batch_job.state.name not in finished_states:
+                if time.monotonic() > deadline:
+                    logger.warning(f"배치 작업 대기 시간 초과: {batch_job.name}")
+                    return results
+                time.sleep(poll_interval)
+                batch_job = self.client.batches.get(name=batch_job.name)
+
+            if batch_job.state.name != 'JOB_STATE_SUCCEEDED':
+                logger.warning(f"배치 작업 실패 ({batch_job.state.name}): {batch_job.error}")
+                return results
+
+            # 인라인 요청의 응답은 제출 순서와 동일
+            for key, inline_response in zip(keys, batch_job.dest.inlined_responses):
+                if inline_response.response:
+                    results[key] = inline_response.response.text
+                    self._set_cached_response(prompts[key], results[key])
+                else:
+                    logger.warning(f"배치 응답 오류 ({key}): {inline_response.error}")
+
+        except Exception as e:
+            logger.error(f"Gemini 배치 작업 중 오류: {e}")
+
+        return results
+
     def json_match(self, text):
         """
         텍스트에서 JSON 객체를 추출하는 함수
         """
         try:
+            # 1. ```json 펜스 내부를 정규식 없이 바로 파싱
+            fence = text.find('```json')
+            if fence != -1:
+                body_end = text.find('```', fence + 7)
+                if body_end != -1:
+                    try:
+                        return orjson.loads(text[fence + 7:body_end])
+                    except json.JSONDecodeError:
+                        pass
+
+            # 2. 괄호 스캐너로 균형 잡힌 {...} 구간을 앞에서부터 시도 (중첩 깊이 제한 없음)
+            for candidate in _iter_json_objects(text):
+                try:
+                    return orjson.loads(candidate)
+                except json.JSONDecodeError:
+                    continue
+
+            # 3. 기존 정규식 방식으로 대체
             # 중괄호 패턴 매칭
-            pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-            matches = re.findall(pattern, text, re.DOTALL)
+            matches = _JSON_OBJ_RE.findall(text)
 
             for match in matches:
                 try:
-                    return json.loads(match)
+                    return orjson.loads(match)
                 except json.JSONDecodeError:
                     continue
 
             # 백틱으로 감싸진 JSON 찾기
-            json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-            matches = re.findall(json_pattern, text, re.DOTALL)
+            matches = _JSON_FENCE_RE.findall(text)
 
             for match in matches:
                 try:
-                    return json.loads(match)
+                    return orjson.loads(match)
                 except json.JSONDecodeError:
                     continue
 
@@ -108,52 +592,26 @@ class IntegratedNewsAnalyzer:
             return None
 
     def create_news_analysis_prompt(self, news_text):
-        """뉴스 분석용 프롬프트 생성"""
-        return f"""
-다음 뉴스들을 분석하여 JSON 형태로 결과를 제공해주세요:
-
-{news_text}
-
-분석 결과를 다음 JSON 형식으로 정확히 제공해주세요:
-
-{{
-  "overall_sentiment": "positive/negative/neutral",
-  "sentiment_score": 0-100,
-  "key_themes": ["주요 테마1", "주요 테마2"],
-  "market_impact": "시장에 미치는 영향 분석",
-  "summary": "전체 뉴스 요약",
-  "investment_signals": "buy/sell/hold"
-}}
-"""
+        """
+        뉴스 분석용 프롬프트 생성
+        (고정 지시문/스키마를 앞에, 매번 달라지는 뉴스 본문을 맨 뒤에 두어 Gemini 암묵적 프롬프트 캐시가 적중하도록 함)
+        """
+        return f"{_NEWS_ANALYSIS_PROMPT_PREFIX}{news_text}\n"
 
     def create_research_reports_analysis_prompt(self, reports_text):
-        """리서치 리포트 분석용 프롬프트 생성"""
-        return f"""
-다음 리서치 리포트들을 분석하여 JSON 형태로 결과를 제공해주세요:
-
-{reports_text}
+        """
+        리서치 리포트 분석용 프롬프트 생성
+        (고정 지시문/스키마를 앞에, 매번 달라지는 리포트 내용을 맨 뒤에 배치)
+        """
+        return f"{_REPORTS_ANALYSIS_PROMPT_PREFIX}{reports_text}\n"
 
-분석 ���과를 다음 JSON 형식으로 정확히 제공해주세요:
+    def _log_cache_usage(self, response):
+        """프롬프트 캐시 적중 토큰 수 로깅"""
+        usage = getattr(response, 'usage_metadata', None)
+        if usage and usage.cached_content_token_count:
+            logger.info(f"♻️ 프롬프트 캐시 적중: {usage.cached_content_token_count}/{usage.prompt_token_count} 토큰")
 
-{{
-  "category_summary": {{
-    "종목분석": "종목분석 요약",
-    "산업분석": "산업분석 요약", 
-    "시황정보": "시황정보 요약",
-    "투자정보": "투자정보 요약"
-  }},
-  "top_mentioned_stocks": ["종목1", "종목2", "종목3"],
-  "key_industries": ["업종1", "업종2", "업종3"],
-  "investment_themes": ["투자테마1", "투자테마2"],
-  "market_outlook": "positive/negative/neutral",
-  "risk_factors": ["리스크1", "리스크2"],
-  "opportunities": ["기회1", "기회2"],
-  "analyst_consensus": "애널리스트 consensus",
-  "summary": "전체 리포트 종합 ���약"
-}}
-"""
-
-    def crawl_and_analyze_all(self, news_section_id: str = "101", news_limit: int = 20, reports_limit: int = 10) -> Dict:
+    def crawl_and_analyze_all(self, news_section_id: str = "101", news_limit: int = 20, reports_limit: int = 10, batch: bool = False) -> Dict:
         """
         뉴스와 리포트를 크롤링하고 분석하여 통합된 결과 반환
 
@@ -161,6 +619,7 @@ class IntegratedNewsAnalyzer:
             news_section_id: 네이버 뉴스 섹션 ID (101: 정치, 102: 경제, 103: 사회 등)
             news_limit: 크롤링할 뉴스 개수
             reports_limit: 크롤링할 리포트 개수 (카테고리별)
+            batch: True면 뉴스/리포트 분석을 Gemini Batch API 작업 하나로 처리 (실패 시 동기 호출로 대체)
 
         Returns:
             Dict: 통합�� 크롤링 및 분석 결과
@@ -180,15 +639,30 @@ class IntegratedNewsAnalyzer:
         # 3. 데이터 분석
         logger.info("🤖 AI 기반 데이터 분석 시작...")
 
+        # 두 분석 프롬프트를 먼저 만들고 한 번에 요청
+        # (배치 모드: Batch API 작업 하나, 기본: 비동기 동시 요청 / 응답이 없는 항목은 아래에서 동기 호출)
+        prompts = {}
+        if news_data:
+            prompts['news'] = self._build_news_prompt(news_data)
+        if reports_data:
+            prompts['reports'] = self._build_reports_prompt(self._categorize_reports(reports_data))
+
+        responses = {}
+        if prompts:
+            if batch:
+                responses = self.ask_questions_to_gemini_batch(prompts)
+            else:
+                responses = asyncio.run(self.ask_questions_to_gemini_async(prompts, tiers=ANALYSIS_TIERS))
+
         # 뉴스 분석
         news_analysis = {}
         if news_data:
-            news_analysis = self.analyze_news_sentiment(news_data)
+            news_analysis = self.analyze_news_sentiment(news_data, response=responses.get('news'))
 
         # 리포트 분석
         reports_analysis = {}
         if reports_data:
-            reports_analysis = self.analyze_research_reports(reports_data)
+            reports_analysis = self.analyze_research_reports(reports_data, response=responses.get('reports'))
 
         # 4. 통합 결과 생성
         integrated_result = {
@@ -238,69 +712,69 @@ class IntegratedNewsAnalyzer:
             url = f"https://news.naver.com/section/{section_id}"
             logger.info(f"📰 네이버 뉴스 섹션 크롤링: {url}")
 
+            self._rate_limiter.acquire()
             response = self.session.get(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
-            # 헤드라인 뉴스 링크 수집
-            headline_selectors = [
-                '.section_headline .sa_text_title',
-                '.section_latest .sa_text_title',
-                '.sa_text_title',
-                'a[href*="/article/"]',
-            ]
-
-            news_links = []
-            for selector in headline_selectors:
-                try:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        if element.name == 'a':
-                            link = element
-                        else:
-                            link = element.find_parent('a') or element.find('a')
-
-                        if link and link.get('href'):
-                            href = link.get('href')
-                            title = link.get_text(strip=True)
-
-                            if '/article/' in href and title and len(title) > 5:
-                                full_url = href if href.startswith('http') else f"https://news.naver.com{href}"
-                                news_links.append({
+            # 헤드라인 뉴스 링크 수집 - 선택자 우선순위 순으로 조회하고 URL을 키로 수집 시점에
+            # 바로 중복 제거 (삽입 순서 유지)
+            unique_by_url: Dict[str, Dict] = {}
+            for selector in _HEADLINE_SELECTORS:
+                for element in soup.select(selector):
+                    if element.name == 'a':
+                        link = element
+                    else:
+                        link = element.find_parent('a') or element.find('a')
+
+                    if link and link.get('href'):
+                        href = link.get('href')
+                        title = link.get_text(strip=True)
+
+                        if '/article/' in href and title and len(title) > 5:
+                            full_url = href if href.startswith('http') else f"https://news.naver.com{href}"
+                            if full_url not in unique_by_url:
+                                # 같은 기사 블록(.sa_text)의 요약문/언론사도 함께 수집
+                                block = link.find_parent(class_='sa_text')
+                                lede = block.select_one('.sa_text_lede') if block else None
+                                press = block.select_one('.sa_text_press') if block else None
+                                unique_by_url[full_url] = {
                                     'title': title,
-                                    'url': full_url
-                                })
+                                    'url': full_url,
+                                    'snippet': lede.get_text(' ', strip=True) if lede else '',
+                                    'media': press.get_text(strip=True) if press else ''
+                                }
 
-                        if len(news_links) >= limit:
-                            break
-
-                    if len(news_links) >= limit:
+                    if len(unique_by_url) >= limit:
                         break
 
-                except Exception as e:
-                    logger.warning(f"선택자 '{selector}' 처리 중 오류: {e}")
-                    continue
+                if len(unique_by_url) >= limit:
+                    break
 
-            # 중복 제거
-            seen_urls = set()
-            unique_news = []
-            for news in news_links:
-                if news['url'] not in seen_urls:
-                    seen_urls.add(news['url'])
-                    unique_news.append(news)
-                    if len(unique_news) >= limit:
-                        break
+            unique_news = list(unique_by_url.values())
 
             logger.info(f"📋 헤드라인 뉴스 {len(unique_news)}개 발견")
 
-            # 각 뉴스의 본문 크롤링
-            for idx, news_item in enumerate(unique_news):
-                try:
-                    logger.info(f"📖 뉴스 본문 크롤링... ({idx + 1}/{len(unique_news)})")
-
-                    content_data = self._crawl_news_content(news_item['url'])
-
+            # 목록 요약이 충분히 긴 기사는 본문 요청 없이 요약을 그대로 사용
+            detail_urls = [n['url'] for n in unique_news if len(n['snippet']) < SNIPPET_MIN_LENGTH]
+            logger.info(f"📄 본문 크롤링 대상 {len(detail_urls)}개 (나머지는 목록 요약 사용)")
+
+            # 각 뉴스의 본문 크롤링 (스레드 풀로 동시 수집, 요청 속도는 토큰 버킷으로 전역 제한)
+            with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as executor:
+                details = dict(zip(detail_urls, executor.map(self._crawl_news_content, detail_urls)))
+
+                for idx, news_item in enumerate(unique_news):
+                    content_data = details.get(news_item['url']) or {}
+                    # 본문 요청 대상이 아니었거나 본문을 얻지 못했으면(실패 시 빈 문자열) 목록 요약으로 대체
+                    # (가져온 날짜/언론사가 있으면 그대로 사용)
+                    if not content_data.get('content'):
+                        content_data = {
+                            'content': news_item['snippet'],
+                            'summary': _summarize(news_item['snippet']),
+                            'publish_date': content_data.get('publish_date', ''),
+                            'media': content_data.get('media') or news_item['media']
+                        }
                     news_data = {
                         'id': idx + 1,
                         'title': news_item['title'],
@@ -316,25 +790,6 @@ class IntegratedNewsAnalyzer:
                     news_list.append(news_data)
                     logger.info(f"✅ 뉴스 수집 완료 ({len(news_list)}/{limit}): '{news_item['title'][:50]}...'")
 
-                    time.sleep(1)  # 서버 부하 방지
-
-                except Exception as e:
-                    logger.error(f"뉴스 본문 크롤링 실패: {e}")
-                    # 기본 정보라도 저장
-                    news_data = {
-                        'id': idx + 1,
-                        'title': news_item['title'],
-                        'url': news_item['url'],
-                        'content': '',
-                        'summary': '',
-                        'publish_date': '',
-                        'media': '',
-                        'category': f'section_{section_id}',
-                        'crawled_at': datetime.now().isoformat()
-                    }
-                    news_list.append(news_data)
-                    continue
-
             logger.info(f"🎉 뉴스 크롤링 완료: 총 {len(news_list)}개 수집")
 
         except Exception as e:
@@ -343,135 +798,67 @@ class IntegratedNewsAnalyzer:
         return news_list
 
     def _crawl_news_content(self, url: str) -> Dict:
-        """개별 뉴스 기사 본문 크롤링 (art_crawl 방식)"""
+        """개별 뉴스 기사 본문 크롤링 (art_crawl 방식, lxml XPath로 필요한 필드만 추출)"""
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            self._rate_limiter.acquire()
+            # 본문은 페이지 앞부분에 있으므로 상한까지만 읽어서 파싱
+            tree = lxml.html.fromstring(self._fetch_bounded(url))
 
-            # 정확한 네이버 뉴스 선택자 사용
-            title_selector = "#title_area > span"
-            date_selector = "#ct > div.media_end_head.go_trans > div.media_end_head_info.nv_notrans > div.media_end_head_info_datestamp > div:nth-child(1) > span"
-            main_selector = "#dic_area"
+            # 제목 추출 (#title_area > span)
+            title = "".join(t.text_content().strip() for t in _XP_NEWS_TITLE(tree))
 
-            # 제목 추출
-            title = ''
-            try:
-                title_elements = soup.select(title_selector)
-                title_lst = [t.get_text(strip=True) for t in title_elements]
-                title = "".join(title_lst)
-            except:
-                pass
-
-            # 발행일 추출
-            publish_date = ''
-            try:
-                date_elements = soup.select(date_selector)
-                date_lst = [d.get_text(strip=True) for d in date_elements]
-                publish_date = "".join(date_lst)
-            except:
+            # 발행일 추출 (#ct 헤더의 첫 번째 datestamp)
+            publish_date = "".join(d.text_content().strip() for d in _XP_NEWS_DATE(tree))
+            if not publish_date:
                 # 대체 선택자들
-                fallback_selectors = [
-                    '.media_end_head_info_datestamp_time',
-                    'span[data-date-time]',
-                    '.author em'
-                ]
-                for selector in fallback_selectors:
-                    try:
-                        date_element = soup.select_one(selector)
-                        if date_element:
-                            publish_date = date_element.get_text(strip=True)
-                            break
-                    except:
-                        continue
-
-            # 본문 추출
-            content = ''
-            try:
-                main_elements = soup.select(main_selector)
-                main_lst = []
-                for m in main_elements:
-                    # 불필요한 요소 제거
-                    for script in m(["script", "style", "iframe"]):
-                        script.decompose()
-
-                    # 네이버 뉴스 특화 불필요 요소 제거
-                    unwanted_selectors = [
-                        '.end_photo_org',
-                        '.media_end_head_journalist',
-                        '.media_end_summary',
-                        'strong.media_end_summary'
-                    ]
-                    for unwanted_selector in unwanted_selectors:
-                        for unwanted in m.select(unwanted_selector):
-                            unwanted.decompose()
+                for xpath in _XP_NEWS_DATE_FALLBACKS:
+                    date_elements = xpath(tree)
+                    if date_elements:
+                        publish_date = date_elements[0].text_content().strip()
+                        break
 
-                    m_text = m.get_text(strip=True)
-                    if m_text:
-                        main_lst.append(m_text)
+            # 본문 추출 (#dic_area)
+            main_lst = []
+            for m in _XP_NEWS_MAIN(tree):
+                # 불필요한 요소를 트리에서 제거하지 않고 XPath 조건으로 텍스트만 걸러냄
+                m_text = "".join(_XP_NEWS_MAIN_TEXT(m)).strip()
+                if m_text:
+                    main_lst.append(m_text)
 
-                content = " ".join(main_lst)
+            # 텍스트 정리
+            content = _WS_RE.sub(' ', " ".join(main_lst)).strip()
 
-                # 텍스트 정리
-                content = re.sub(r'\s+', ' ', content).strip()
+            # 불필요한 문구 제거 (문구별 반복 스캔 대신 한 번의 검색으로 가장 앞선 위치 탐색)
+            unwanted = _UNWANTED_PHRASE_RE.search(content)
+            if unwanted:
+                content = content[:unwanted.start()].strip()
 
-                # 불필요한 문구 제거
-                unwanted_phrases = [
-                    "무단전재 및 재배포 금지",
-                    "저작권자",
-                    "ⓒ",
-                    "Copyright"
-                ]
-                for phrase in unwanted_phrases:
-                    if phrase in content:
-                        content = content.split(phrase)[0].strip()
-
-            except:
-                # ���체 선택자들
-                fallback_selectors = [
-                    '#articleBodyContents',
-                    '.go_trans._article_content',
-                    '._article_body_contents'
-                ]
-                for selector in fallback_selectors:
-                    try:
-                        content_element = soup.select_one(selector)
-                        if content_element:
-                            for script in content_element(["script", "style"]):
-                                script.decompose()
-                            content = content_element.get_text(strip=True)
-                            if len(content) > 50:
-                                break
-                    except:
-                        continue
+            if not content:
+                # 대체 선택자들
+                for xpath in _XP_NEWS_CONTENT_FALLBACKS:
+                    content_elements = xpath(tree)
+                    if content_elements:
+                        content_element = content_elements[0]
+                        etree.strip_elements(content_element, 'script', 'style', with_tail=False)
+                        content = content_element.text_content().strip()
+                        if len(content) > 50:
+                            break
 
             # 요약 생성
-            summary = ''
-            if content:
-                sentences = content.split('.')
-                if sentences:
-                    summary = sentences[0][:200] + ('...' if len(sentences[0]) > 200 else '')
+            summary = _summarize(content)
 
             # 언론사 추출
             media = ''
-            media_selectors = [
-                '.media_end_head_top_logo img',
-                '.press_logo img',
-                '.media_end_head_top_logo_text'
-            ]
-            for selector in media_selectors:
-                try:
-                    media_element = soup.select_one(selector)
-                    if media_element:
-                        if media_element.name == 'img':
-                            media = media_element.get('alt', '')
-                        else:
-                            media = media_element.get_text(strip=True)
-                        if media:
-                            break
-                except:
-                    continue
+            for xpath in _XP_NEWS_MEDIA:
+                media_elements = xpath(tree)
+                if media_elements:
+                    media_element = media_elements[0]
+                    if media_element.tag == 'img':
+                        media = media_element.get('alt', '')
+                    else:
+                        media = media_element.text_content().strip()
+                    if media:
+                        break
 
             return {
                 'content': content,
@@ -509,37 +896,39 @@ class IntegratedNewsAnalyzer:
             try:
                 logger.info(f"📊 {category_name} 리포트 크롤링... ({category_url})")
 
-                response = self.session.get(category_url, timeout=10)
+                self._rate_limiter.acquire()
+                response = self.session.get(category_url)
                 response.raise_for_status()
 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                # <table> 하위만 파싱 (나머지 페이지는 트리를 만들지 않음)
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=_TABLE_STRAINER)
 
                 # 리포트 테이블 찾기
                 table_selectors = [
                     'table.type_1',
                     'table.type_2',
                     'table[summary*="리포트"]',
-                    'div.box_type_m table',
                     'table'
                 ]
 
-                table = None
+                rows = []
                 for selector in table_selectors:
                     table = soup.select_one(selector)
-                    if table and len(table.find_all('tr')) > 1:
+                    rows = table.find_all('tr') if table else []
+                    if len(rows) > 1:
                         logger.info(f"{category_name} 리포트 테이블 발견")
                         break
 
-                if not table:
+                if not rows:
                     logger.warning(f"{category_name}: 리포트 테이블을 찾을 수 없습니다.")
                     continue
 
-                rows = table.find_all('tr')
                 data_rows = rows[1:] if rows[0].find('th') else rows
 
-                count = 0
+                # 1차: 목록 행에서 리포트 정보만 수집
+                candidates = []
                 for row in data_rows:
-                    if count >= limit:
+                    if len(candidates) >= limit:
                         break
 
                     cells = row.find_all('td')
@@ -585,9 +974,18 @@ class IntegratedNewsAnalyzer:
                                 provider = cell_text
                                 break
 
-                        # 리포트 상세 내용 크롤링 (간소화)
-                        content = self._crawl_report_content(link)
+                        candidates.append((title, link, publish_date, provider))
 
+                    except Exception as e:
+                        logger.error(f"{category_name} 리포트 처리 중 오류: {e}")
+                        continue
+
+                # 2차: 리포트 상세 내용 동시 크롤링 (간소화)
+                with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as executor:
+                    contents = executor.map(self._crawl_report_content, [c[1] for c in candidates])
+
+                    count = 0
+                    for (title, link, publish_date, provider), content in zip(candidates, contents):
                         report_data = {
                             'id': len(all_reports) + 1,
                             'title': title,
@@ -605,14 +1003,7 @@ class IntegratedNewsAnalyzer:
 
                         logger.info(f"✅ {category_name}: '{title[:30]}...' 리포트 수집 완료 ({count}/{limit})")
 
-                        time.sleep(1)  # 서버 부하 방지
-
-                    except Exception as e:
-                        logger.error(f"{category_name} 리포트 처리 중 오류: {e}")
-                        continue
-
                 logger.info(f"🎯 {category_name}: {count}개 리포트 수집 완료")
-                time.sleep(2)  # 카테고리 간 딜레이
 
             except Exception as e:
                 logger.error(f"{category_name} 카테고리 크롤링 중 오류: {e}")
@@ -624,10 +1015,8 @@ class IntegratedNewsAnalyzer:
     def _crawl_report_content(self, link: str) -> str:
         """리포트 상세 내용 크롤링 (간소화)"""
         try:
-            response = self.session.get(link, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            self._rate_limiter.acquire()
+            soup = BeautifulSoup(self._fetch_bounded(link), 'lxml')
 
             content_selectors = [
                 'div.view_cnt',
@@ -648,7 +1037,7 @@ class IntegratedNewsAnalyzer:
                         text = content_div.get_text(separator=' ', strip=True)
 
                         # 텍스트 정리
-                        text = re.sub(r'\s+', ' ', text).strip()
+                        text = _WS_RE.sub(' ', text).strip()
 
                         if len(text) > 100:
                             return text[:500] + "..." if len(text) > 500 else text
@@ -663,19 +1052,7 @@ class IntegratedNewsAnalyzer:
 
     def _is_valid_date(self, text: str) -> bool:
         """날짜 형식 검증"""
-        import re
-        date_patterns = [
-            r'\d{4}[-./]\d{1,2}[-./]\d{1,2}',
-            r'\d{1,2}[-./]\d{1,2}[-./]\d{2,4}',
-            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
-            r'\d{2}\.\d{2}\.\d{2}',
-            r'\d{4}\.\d{2}\.\d{2}',
-        ]
-
-        for pattern in date_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
+        return _DATE_COMBINED.search(text) is not None
 
     def _save_integrated_json(self, data: Dict, filename: str = None) -> str:
         """통합 결과를 JSON 파일로 저장"""
@@ -684,8 +1061,9 @@ class IntegratedNewsAnalyzer:
             filename = f"integrated_news_research_{timestamp}.json"
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # orjson은 UTF-8 바이트를 바로 생성하므로 바이너리 모드로 기록
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
             logger.info(f"📁 통합 JSON 파일 저장 완료: {filename}")
             return filename
@@ -694,12 +1072,41 @@ class IntegratedNewsAnalyzer:
             logger.error(f"JSON 파일 저장 실패: {e}")
             return None
 
-    def analyze_news_sentiment(self, news_data: List[Dict]) -> Dict:
+    def _build_news_prompt(self, news_data: List[Dict]) -> str:
+        """뉴스 데이터로 감정 분석 프롬프트 생성"""
+        # 뉴스 제목과 내용을 하나의 텍스트로 결합 (조각을 리스트에 모아 마지막에 한 번만 join)
+        parts = []
+        # URL만 다르고 제목/본문이 같은 전재 기사는 프롬프트에 한 번만 포함 (제목 + 본문 앞 500자 해시로 판별)
+        seen = set()
+        idx = 0
+        for news in news_data:
+            title = news.get('title', '')
+            content = news.get('content', '')
+            digest = hashlib.blake2b(f"{title}\n{content[:500]}".encode('utf-8'), digest_size=16).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+            idx += 1
+
+            parts.append(f"\n\n--- 뉴스 {idx} ---\n")
+            parts.append(f"제목: {title}\n")
+            # content가 비어있으면 제목만 사용
+            if content.strip():
+                parts.append(f"내용: {content[:500]}...\n")
+            else:
+                parts.append(f"내용: 제목 참조\n")
+
+        # 통합된 프롬프트 생성 함수 사용
+        return self.create_news_analysis_prompt("".join(parts))
+
+    def analyze_news_sentiment(self, news_data: List[Dict], response: str = None, now_iso: str = None) -> Dict:
         """
         뉴스 감정 분석
 
         Args:
             news_data: 뉴스 데이터 리스트
+            response: 이미 받은 Gemini 응답 (배치 모드), None이면 직접 호출
+            now_iso: 분석 시각 (없으면 현재 시각 사용)
 
         Returns:
             Dict: 감정 분석 결과
@@ -707,28 +1114,15 @@ class IntegratedNewsAnalyzer:
         if not news_data:
             return {"error": "분석할 뉴스 데이터가 없습니다."}
 
-        # 뉴스 제목과 내용을 하나의 텍스트로 결합
-        combined_text = ""
-        for idx, news in enumerate(news_data, 1):
-            combined_text += f"\n\n--- 뉴스 {idx} ---\n"
-            combined_text += f"제목: {news.get('title', '')}\n"
-            # content가 비어있으면 제목만 사용
-            content = news.get('content', '')
-            if content.strip():
-                combined_text += f"내용: {content[:500]}...\n"
-            else:
-                combined_text += f"내용: 제목 참조\n"
-
-        # 통합된 프롬프트 생성 함수 사용
-        prompt = self.create_news_analysis_prompt(combined_text)
-
         try:
-            response = self.ask_question_to_gemini_cache(prompt)
+            if response is None:
+                response = self.ask_question_to_gemini_cache(self._build_news_prompt(news_data), tier=ANALYSIS_TIERS['news'])
 
             parsed_result = self.json_match(response)
+            analyzed_at = now_iso or datetime.now().isoformat()
 
             if parsed_result:
-                parsed_result['analyzed_at'] = datetime.now().isoformat()
+                parsed_result['analyzed_at'] = analyzed_at
                 parsed_result['news_count'] = len(news_data)
                 return parsed_result
             else:
@@ -740,7 +1134,7 @@ class IntegratedNewsAnalyzer:
                     "market_impact": "JSON 파싱 실패로 상세 분석을 제공할 수 없습니다.",
                     "summary": "뉴스 분석 중 오류가 발생했습니다.",
                     "investment_signals": "hold",
-                    "analyzed_at": datetime.now().isoformat(),
+                    "analyzed_at": analyzed_at,
                     "news_count": len(news_data),
                     "error": "JSON 파싱 실패"
                 }
@@ -749,12 +1143,29 @@ class IntegratedNewsAnalyzer:
             logger.error(f"뉴스 감정 분석 중 오류: {e}")
             return {"error": f"분석 중 오류 발생: {str(e)}"}
 
-    def analyze_research_reports(self, reports_data: List[Dict]) -> Dict:
+    def _categorize_reports(self, reports_data: List[Dict]) -> Dict:
+        """카테고리별로 리포트 분류 (처음 보는 카테고리는 defaultdict가 빈 리스트 생성)"""
+        categorized_reports = defaultdict(list)
+        for report in reports_data:
+            categorized_reports[report.get('category_name', 'unknown')].append(report)
+        return categorized_reports
+
+    def _build_reports_prompt(self, categorized_reports: Dict) -> str:
+        """카테고리별 리포트로 리서치 리포트 분석 프롬프트 생성"""
+        # 분석용 텍스트 생성
+        combined_text = self._format_reports_for_analysis(categorized_reports)
+
+        # 통합된 리서치 리포트 분석 프롬프트 사용
+        return self.create_research_reports_analysis_prompt(combined_text)
+
+    def analyze_research_reports(self, reports_data: List[Dict], response: str = None, now_iso: str = None) -> Dict:
         """
         리서치 리포트 분석 (개선된 버전 - 카테고리별 분석 포괄)
 
         Args:
             reports_data: 리포트 데이터 리스트
+            response: 이미 받은 Gemini 응답 (배치 모드), None이면 직접 호출
+            now_iso: 분석 시각 (없으면 현재 시각 사용)
 
         Returns:
             Dict: 리포트 분석 결과
@@ -763,45 +1174,22 @@ class IntegratedNewsAnalyzer:
             return {"error": "분석할 리포트 데이터가 없습니다."}
 
         # 카테고리별로 리포트 분류
-        categorized_reports = {}
-        for report in reports_data:
-            category = report.get('category_name', 'unknown')
-            if category not in categorized_reports:
-                categorized_reports[category] = []
-            categorized_reports[category].append(report)
-
-        # 분석용 텍스트 생성
-        combined_text = self._format_reports_for_analysis(categorized_reports)
-
-        # 통합된 리서치 리포트 분석 프롬프트 사용
-        prompt = self.create_research_reports_analysis_prompt(combined_text)
+        categorized_reports = self._categorize_reports(reports_data)
 
         try:
-            response = self.ask_question_to_gemini_cache(prompt)
+            if response is None:
+                response = self.ask_question_to_gemini_cache(self._build_reports_prompt(categorized_reports), tier=ANALYSIS_TIERS['reports'])
 
             parsed_result = self.json_match(response)
+            analyzed_at = now_iso or datetime.now().isoformat()
 
             if parsed_result:
-                # 필수 항목이 모두 포함되었는지 검증
-                required_fields = [
-                    'category_summary', 'top_mentioned_stocks', 'key_industries',
-                    'investment_themes', 'market_outlook', 'risk_factors',
-                    'opportunities', 'analyst_consensus', 'summary'
-                ]
-
-                # 누락된 필드가 있으면 기본값으로 채우기
-                for field in required_fields:
+                # 누락된 필수 항목은 기본값으로 채우기 (기본값은 공유되지 않도록 복사본 사용)
+                for field, default in _REPORTS_REQUIRED_DEFAULTS.items():
                     if field not in parsed_result:
-                        if field == 'category_summary':
-                            parsed_result[field] = {"종목분석": "분석 데이터 부족", "산업분석": "분석 데이터 부족", "시황정보": "분석 데이터 부족", "투자정보": "분석 데이터 부족"}
-                        elif field in ['top_mentioned_stocks', 'key_industries', 'investment_themes', 'risk_factors', 'opportunities']:
-                            parsed_result[field] = ["데이터 부족"]
-                        elif field == 'market_outlook':
-                            parsed_result[field] = "neutral"
-                        elif field in ['analyst_consensus', 'summary']:
-                            parsed_result[field] = "분석 데이터가 부족합니다."
-
-                parsed_result['analyzed_at'] = datetime.now().isoformat()
+                        parsed_result[field] = copy.deepcopy(default)
+
+                parsed_result['analyzed_at'] = analyzed_at
                 parsed_result['reports_count'] = len(reports_data)
                 parsed_result['category_counts'] = {
                     cat: len(reports) for cat, reports in categorized_reports.items()
@@ -825,7 +1213,7 @@ class IntegratedNewsAnalyzer:
                     "analyst_consensus": "리포트 분석 중 JSON 파싱 오류가 발생했습니다.",
                     "summary": "전체 리포트 분석 중 오류가 발생하여 상세 분석을 제공할 수 없습니다.",
                     "raw_response": response,
-                    "analyzed_at": datetime.now().isoformat(),
+                    "analyzed_at": analyzed_at,
                     "reports_count": len(reports_data),
                     "error": "JSON 파싱 실패"
                 }
@@ -838,68 +1226,66 @@ class IntegratedNewsAnalyzer:
         """
         카테고리별 리포트 데이터를 분석할 텍스트로 포맷팅
         """
-        formatted_text = ""
-
-        category_names = {
-            'stock_analysis': '종목분석 리포트',
-            'industry_analysis': '산업분석 리포트',
-            'market_info': '시황정보 리포트',
-            'investment_info': '투자정보 리포트',
-            '종목분석': '종목분석 리포트',
-            '산업분석': '산업분석 리포트',
-            '시황정보': '시황정보 리포트',
-            '투자정보': '투자정보 리포트'
-        }
-
-        for category, reports in categorized_reports.items():
-            if reports:
-                display_name = category_names.get(category, category)
-                formatted_text += f"\n\n=== {display_name} ===\n"
-
-                for idx, report in enumerate(reports, 1):
-                    formatted_text += f"\n{idx}. 제목: {report.get('title', 'N/A')}\n"
-
-                    if report.get('provider'):
-                        formatted_text += f"   증권사: {report['provider']}\n"
-
-                    # summary가 비어있으면 제목으로 대체
-                    summary = report.get('summary', '')
-                    if summary.strip() and summary != "요약 내용을 찾을 수 없습니다.":
-                        formatted_text += f"   요약: {summary[:200]}...\n"
-                    else:
-                        formatted_text += f"   요약: 제목 참조\n"
-
-                    if report.get('publish_date'):
-                        formatted_text += f"   날짜: {report['publish_date']}\n"
-
-        return formatted_text
-
-    def analyze_comprehensive_with_categories(self, crawled_data: Dict) -> Dict:
+        # 포맷에 쓰이는 필드만 튜플로 묶어 캐시 키로 사용
+        reports_key = tuple(
+            (category, tuple(
+                # 리포트당 필드 조회는 여기서 한 번씩만, 포맷 단계에서는 언패킹한 지역 변수로 참조
+                (report.get('title', 'N/A'), report.get('provider'), report.get('summary') or '', report.get('publish_date'))
+                for report in reports
+            ))
+            for category, reports in categorized_reports.items()
+        )
+        return _format_reports_text(reports_key)
+
+    def analyze_comprehensive_with_categories(self, crawled_data: Dict, batch: bool = False) -> Dict:
         """
         카테고리별 상세 분석을 포함한 종합 분석
 
         Args:
             crawled_data: 크롤링된 전체 데이터
+            batch: True면 뉴스/리포트 분석을 Gemini Batch API 작업 하나로 처리
+                   (crawled_data에 realtime=True가 있으면 무시하고 동시 요청 사용)
 
         Returns:
             Dict: 종합 분석 결과 (카테고리별 세부 분석 포함)
         """
         logger.info("카테고리별 상세 종합 분석 시작")
+        # 한 번의 파이프라인 실행에서는 같은 생성 시각을 공유
+        now_iso = datetime.now().isoformat()
+
+        # 입력 리스트는 한 번만 꺼내 두고 이후 단계에서 재사용
+        main_news = crawled_data.get('main_news') or []
+        research_reports = crawled_data.get('research_reports') or []
+
+        # 뉴스/리포트 분석 프롬프트를 한 번에 요청
+        # (배치 모드: Batch API 작업 하나, 기본/실시간: 비동기 동시 요청 → 전체 대기 시간 = 가장 느린 요청 하나)
+        prompts = {}
+        if main_news:
+            prompts['news'] = self._build_news_prompt(main_news)
+        if research_reports:
+            prompts['reports'] = self._build_reports_prompt(self._categorize_reports(research_reports))
+
+        responses = {}
+        if prompts:
+            if batch and not crawled_data.get('realtime'):
+                responses = self.ask_questions_to_gemini_batch(prompts)
+            else:
+                responses = asyncio.run(self.ask_questions_to_gemini_async(prompts, tiers=ANALYSIS_TIERS))
 
         # 전체 뉴스 감정 분석
-        news_analysis = self.analyze_news_sentiment(crawled_data.get('main_news', []))
+        news_analysis = self.analyze_news_sentiment(main_news, response=responses.get('news'), now_iso=now_iso)
         logger.info("뉴스 감정 분석 완료")
 
         # 리서치 리포트 분석
-        reports_analysis = self.analyze_research_reports(crawled_data.get('research_reports', []))
+        reports_analysis = self.analyze_research_reports(research_reports, response=responses.get('reports'), now_iso=now_iso)
         logger.info("리서치 리포트 분석 완료")
 
         # 카테고리별 심화 분석
-        category_insights = self._generate_category_insights(crawled_data.get('research_reports', []))
+        category_insights = self._generate_category_insights(research_reports, now_iso=now_iso)
         logger.info("카테고리별 심화 분석 완료")
 
         # 일일 종합 리포트 생성
-        daily_report = self.generate_enhanced_daily_report(news_analysis, reports_analysis, category_insights)
+        daily_report = self.generate_enhanced_daily_report(news_analysis, reports_analysis, category_insights, now_iso=now_iso)
         logger.info("일일 종합 리포트 생성 완료")
 
         return {
@@ -908,58 +1294,37 @@ class IntegratedNewsAnalyzer:
             'category_insights': category_insights,
             'daily_report': daily_report,
             'meta': {
-                'total_analyzed': len(crawled_data.get('main_news', [])) + len(crawled_data.get('research_reports', [])),
-                'analysis_completed_at': datetime.now().isoformat()
+                'total_analyzed': len(main_news) + len(research_reports),
+                'analysis_completed_at': now_iso
             }
         }
 
-    def _generate_category_insights(self, reports_data: List[Dict]) -> Dict:
+    def _generate_category_insights(self, reports_data: List[Dict], now_iso: str = None) -> Dict:
         """
-        카테고리별 심화 인사이트 생성
+        카테고리별 심화 인사이트 생성 (now_iso가 없으면 현재 시각 사용)
         """
         if not reports_data:
             return {"error": "분석할 리포트가 없습니다."}
 
-        # 카테고리별 통계
-        category_stats = {}
-        for report in reports_data:
-            category = report.get('category_name', 'Unknown')
-            if category not in category_stats:
-                category_stats[category] = {
-                    'count': 0,
-                    'firms': set(),
-                    'stocks': set(),
-                    'recent_titles': []
-                }
-
-            category_stats[category]['count'] += 1
-
-            if report.get('provider'):
-                category_stats[category]['firms'].add(report['provider'])
-
-            if report.get('title'):
-                category_stats[category]['recent_titles'].append(report['title'])
-
-        # 통계를 JSON 직렬화 가능한 ���태로 변환
-        formatted_stats = {}
-        for category, stats in category_stats.items():
-            formatted_stats[category] = {
-                'count': stats['count'],
-                'active_firms': list(stats['firms'])[:5],  # 최대 5개
-                'mentioned_stocks': list(stats['stocks'])[:10],  # 최대 10개
-                'sample_titles': stats['recent_titles'][:3]  # 최대 3개
-            }
+        # 통계에 쓰이는 필드만 튜플로 묶어 캐시 키로 사용
+        reports_key = tuple(
+            (report.get('category_name', 'Unknown'), report.get('provider'), report.get('title'))
+            for report in reports_data
+        )
+        formatted_stats, most_active_category = _compute_category_insights(reports_key)
+        # 캐시된 통계를 그대로 내보내면 호출 측 수정이 이후 캐시 적중 결과까지 바꾸므로 복사본 반환
+        formatted_stats = copy.deepcopy(formatted_stats)
 
         return {
             'category_statistics': formatted_stats,
-            'total_categories': len(category_stats),
-            'most_active_category': max(category_stats.keys(), key=lambda k: category_stats[k]['count']) if category_stats else None,
-            'generated_at': datetime.now().isoformat()
+            'total_categories': len(formatted_stats),
+            'most_active_category': most_active_category,
+            'generated_at': now_iso or datetime.now().isoformat()
         }
 
-    def generate_enhanced_daily_report(self, news_analysis: Dict, reports_analysis: Dict, category_insights: Dict) -> Dict:
+    def generate_enhanced_daily_report(self, news_analysis: Dict, reports_analysis: Dict, category_insights: Dict, now_iso: str = None) -> Dict:
         """
-        카테고리 인사이트를 포함한 개선된 일일 리포트 생성
+        카테고리 인사이트를 포함한 개선된 일일 리포트 생성 (now_iso가 없으면 현재 시각 사용)
         """
         # 간단한 점수 계산
         try:
@@ -974,7 +1339,7 @@ class IntegratedNewsAnalyzer:
                     "시장 동향을 지속적으로 모니터링하세요",
                     "리스크 관리를 철저히 하세요"
                 ],
-                'generated_at': datetime.now().isoformat()
+                'generated_at': now_iso or datetime.now().isoformat()
             }
         except Exception as e:
             logger.error(f"일일 리포트 생성 중 오류: {e}")
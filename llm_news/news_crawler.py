@@ -3,30 +3,603 @@
 """
 
 import requests
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, parse_qsl, urlencode
 from bs4 import BeautifulSoup
+import soupsieve as sv
+from lxml import etree, html as lxml_html
+from selectolax.lexbor import LexborHTMLParser
 import time
 from datetime import datetime
 from typing import List, Dict
 import logging
 import json
+import orjson
 import re
+import os
+import codecs
+import heapq
+from dataclasses import dataclass, asdict
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # 로깅 설정 (간단한 진행 상황 표시)
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# 뉴스/리포트 상세 페이지 동시 크롤링 스레드 수
+DETAIL_WORKERS = 8
+
+# 뉴스 본문 컨테이너 선택자 (우선순위 순)
+ARTICLE_CONTENT_SELECTORS = [
+    # 사진에서 확인한 정확한 네이버 뉴스 구조
+    'article#dic_area.go_trans._article_content',
+    'article#dic_area',
+    'div#dic_area',
+
+    # 네이버 뉴스 본문 컨테이너의 다양한 패턴
+    'div#newsct_article',
+    'div.newsct_article',
+    'div#contents div#newsct_article',
+    'div.newsct_body',
+    'div#contents.newsct_body div#newsct_article',
+
+    # 일반적인 뉴스 사이트 패턴
+    'div#articleBodyContents',
+    'article.article-body',
+    'div.article-body',
+    'div.news-content',
+    'div.article-content',
+    'div.content-body',
+    'div.post-content',
+    'div.entry-content',
+
+    # 더 일반적인 패턴
+    'div[class*="content"]',
+    'div[class*="article"]',
+    'div[id*="content"]',
+    'div[id*="article"]',
+    'main',
+    'section[class*="content"]'
+]
+
+# 본문 컨테이너 안에서 제거할 요소 선택자 (네이버 뉴스 특화 포함)
+ARTICLE_UNWANTED_SELECTORS = [
+    'script', 'style', 'iframe', 'noscript',
+    '.ad', '.advertise', '.advertisement',
+    '.related', '.comment', '.social',
+    'nav', 'header', 'footer', '.sidebar',
+    '.media_end_head', '.byline', '.copyright',
+    '.journalist', '.reporter_info',
+    '.end_photo_org',  # 사진 설명 제거
+    '.media_end_head_info',  # 헤더 정보 제거
+    '.media_end_head_journalist',  # 기자 정보 제거
+    'span.end_photo_org',  # 사진 관련 span 제거
+    '.media_end_summary',  # 요약 제거
+    'strong.media_end_summary'  # 요약 제거
+]
+
+# 본문에서 이 문구가 나오면 그 이후를 잘라냄
+ARTICLE_UNWANTED_PHRASES = [
+    "무단전재 및 재배포 금지",
+    "저작권자",
+    "ⓒ",
+    "Copyright",
+    "All rights reserved",
+    "본 기사는",
+    "기자 "
+]
+
+# 문구별로 반복 스캔하지 않도록 하나의 alternation으로 컴파일
+ARTICLE_UNWANTED_PHRASE_RE = re.compile('|'.join(map(re.escape, ARTICLE_UNWANTED_PHRASES)))
+
+# 리서치 리포트 본문 후보에 있으면 해당 후보를 버리는 네이버 거래연결 안내 문구
+REPORT_BLOCKED_PHRASE_RE = re.compile('|'.join(map(re.escape, (
+    "네이버 주식거래연결",
+    "빠른 주문을 도와드립니다",
+    "증권사의 로그인을 연결",
+    "네이버는 증권사 서비스의 시스템 장애에 따른 법적 책임을 지지 않습니다"
+))))
+
+# 리서치 리포트 p 태그 결합 시 건너뛸 문구
+REPORT_PARAGRAPH_SKIP_RE = re.compile('|'.join(map(re.escape, (
+    '주식거래연결', '로그인을 연결', '법적 책임', '시스템 장애'
+))))
+
+# 리서치 리포트 행의 발행일 (YY.MM.DD, YYYY-MM-DD 등)
+DATE_RE = re.compile(r'\b(?:\d{2}|\d{4})[./-]\d{1,2}[./-]\d{1,2}\b')
+
+# 리서치 리포트 행에서 제공자(증권사) 키워드를 포함한 셀 전체 (셀은 탭으로 구분)
+PROVIDER_RE = re.compile(r'[^\t]*(?:증권|투자|자산|캐피탈|Securities)[^\t]*')
+
+# 연속 공백 정리용
+WHITESPACE_RE = re.compile(r'\s+')
+
+# 기사 URL 쿼리의 날짜 (date=2025-08-03 / date=20250803)
+URL_DATE_RE = re.compile(r'date=(\d{4}-?\d{2}-?\d{2})')
+
+# 텍스트가 날짜 형식인지 판별하는 패턴들
+DATE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'\d{4}[-./]\d{1,2}[-./]\d{1,2}',  # 2025-08-03
+    r'\d{1,2}[-./]\d{1,2}[-./]\d{2,4}',  # 08-03-2025
+    r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',  # 2025년 8월 3일
+    r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',  # ISO 형식
+    r'\d{2}\.\d{2}\.\d{2}',  # 25.08.03
+    r'\d{4}\.\d{2}\.\d{2}',  # 2025.08.03
+)]
+
+# 네이버 뉴스 본문 컨테이너 id (스트리밍 파싱에서 이 요소가 닫히면 즉시 중단)
+NAVER_ARTICLE_IDS = ('dic_area', 'newsct_article')
+
+# 스트리밍 파싱 시 한 번에 넣을 바이트 수
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# 문서에 선언된 문자 인코딩 (<meta charset> / http-equiv Content-Type), 선언은 문서 앞부분에서만 찾음
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+CHARSET_SNIFF_BYTES = 4096
+
+
+# 상세 페이지 캐시 키에서 제외할 목록/추적용 쿼리 파라미터
+TRACKING_QUERY_PARAMS = ('page',)
+
+# 조건부 GET 페이지 캐시 상한 (마지막 사용 후 보관 기간, 보관할 최대 페이지 수)
+PAGE_CACHE_MAX_AGE = 7 * 24 * 3600
+PAGE_CACHE_MAX_ENTRIES = 2000
+
+
+def _canonical_url(url: str) -> str:
+    """추적용 파라미터(utm_*, page)와 fragment를 제거하고 쿼리를 정렬한 캐시 키용 URL"""
+    parsed = urlparse(url)
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in TRACKING_QUERY_PARAMS
+    )
+    return parsed._replace(query=urlencode(query), fragment='').geturl()
+
+
+@lru_cache(maxsize=512)
+def _is_valid_date(text: str) -> bool:
+    """
+    텍스트가 유효한 날짜 형식인지 확인 (순수 함수 - 같은 날짜 문자열이 반복되므로 결과를 캐시)
+
+    Args:
+        text: 확인할 텍스트
+
+    Returns:
+        bool: 유효한 날짜 형식인지 여부
+    """
+    return any(pattern.search(text) for pattern in DATE_PATTERNS)
+
+
+def _sniff_encoding(html: bytes) -> str:
+    """
+    파서 트리를 만들지 않고 문서 앞부분의 meta 선언으로 인코딩 판별 (선언이 없거나 알 수 없으면 utf-8)
+    EUC-KR 선언은 확장 한글까지 포함하는 상위 집합 cp949로 읽음 (브라우저와 동일)
+    """
+    match = META_CHARSET_RE.search(html, 0, CHARSET_SNIFF_BYTES)
+    if not match:
+        return 'utf-8'
+    try:
+        encoding = codecs.lookup(match.group(1).decode('ascii')).name
+    except LookupError:
+        return 'utf-8'
+    return 'cp949' if encoding == 'euc_kr' else encoding
+
+
+def _prune_cache_dir(directory: str, max_age: float, max_entries: int) -> None:
+    """
+    파일 캐시 디렉터리 정리 - 같은 키(확장자 제외 파일명)의 파일을 한 항목으로 보고,
+    마지막 사용(mtime) 후 max_age초가 지났거나 최근 사용 순으로 max_entries개를 넘는 항목 삭제
+    """
+    entries: Dict[str, List] = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file():
+                    key = os.path.splitext(entry.path)[0]
+                    entries.setdefault(key, []).append((entry.path, entry.stat().st_mtime))
+    except OSError:
+        return
+
+    now = time.time()
+    ordered = sorted(entries.values(), key=lambda files: max(mtime for _, mtime in files), reverse=True)
+    removed = 0
+    for idx, files in enumerate(ordered):
+        if idx < max_entries and now - max(mtime for _, mtime in files) <= max_age:
+            continue
+        for path, _ in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        removed += 1
+
+    if removed:
+        logger.info(f"캐시 정리: {directory}에서 {removed}개 항목 삭제")
+
+
+def _decompose_outermost(nodes) -> None:
+    """
+    selectolax css() 결과 중 다른 매치의 하위가 아닌 노드만 제거
+
+    합친 선택자는 부모와 자식을 함께 매치할 수 있는데, 부모를 제거하면 자식 노드 객체는
+    해제된 메모리를 가리키므로 제거 전에 가장 바깥 노드만 골라 제거
+    """
+    matched = {node.mem_id for node in nodes}
+    outermost = []
+    for node in nodes:
+        parent = node.parent
+        while parent is not None and parent.mem_id not in matched:
+            parent = parent.parent
+        if parent is None:
+            outermost.append(node)
+    for node in outermost:
+        node.decompose()
+
+
+def _css_class(name: str) -> str:
+    """CSS 클래스 선택자(.name)와 같은 의미의 XPath 조건식"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def _css_ascii(selector: str) -> str:
+    """비ASCII 문자를 CSS 이스케이프(\\XXXX )로 바꾼 선택자 (selectolax 0.3의 lexbor는 한글이 든 선택자를 파싱하지 못함)"""
+    return ''.join(ch if ord(ch) < 128 else f'\\{ord(ch):X} ' for ch in selector)
+
+
+# 본문 컨테이너 안의 불필요 요소 (ARTICLE_UNWANTED_SELECTORS의 태그/클래스를 XPath로 표현)
+_XP_ARTICLE_UNWANTED = etree.XPath(
+    './/*[self::nav or self::header or self::footer or '
+    + ' or '.join(_css_class(name) for name in (
+        'ad', 'advertise', 'advertisement', 'related', 'comment', 'social', 'sidebar',
+        'media_end_head', 'byline', 'copyright', 'journalist', 'reporter_info',
+        'end_photo_org', 'media_end_head_info', 'media_end_head_journalist', 'media_end_summary'
+    ))
+    + ']'
+)
+
+# selectolax 경로용 제거 선택자 (콤마 합집합 하나로 한 번만 순회)
+ARTICLE_UNWANTED_CSS = ', '.join(ARTICLE_UNWANTED_SELECTORS)
+
+# BeautifulSoup 경로용으로 미리 컴파일한 본문/제거 선택자
+ARTICLE_CONTENT_SOUP_SELECTORS = [sv.compile(selector) for selector in ARTICLE_CONTENT_SELECTORS]
+# 제거 선택자는 콤마 합집합 하나로 묶어 하위 트리를 한 번만 순회
+ARTICLE_UNWANTED_SOUP_SELECTOR = sv.compile(', '.join(ARTICLE_UNWANTED_SELECTORS))
+
+# 증권 뉴스 목록의 기사 링크 선택자 (모듈 로드 시 한 번만 컴파일)
+NEWS_LIST_SELECTORS = [sv.compile(selector) for selector in (
+    '.newslist .articleSubject a',  # 뉴스 리스트의 기사 제목
+    '.newsList .articleSubject a',
+    '.articleSubject a',            # 기본 기사 제목
+    '.news_list .subject a',        # 뉴스 리스트 제목
+    '.type2 .subject a',            # type2 스타일의 제목
+    '.headline_list .subject a',    # 헤드라인 리스트
+    '.articleSubject',              # 제목 요소 자체
+    'td.subject a',                 # 테이블 형태의 제목
+    '.tb_type1 .subject a',         # 테이블 type1의 제목
+    'a[href*="news_read"]',         # 뉴스 읽기 링크 포함
+)]
+
+# 리서치 리포트 목록 테이블 XPath (우선순위 순)
+REPORT_TABLE_XPATHS = [etree.XPath(path) for path in (
+    f'//table[{_css_class("type_1")}]',  # 주로 사용되는 테이블 클래스
+    f'//table[{_css_class("type_2")}]',
+    '//table[contains(@summary, "리포트")]',
+    f'//div[{_css_class("box_type_m")}]//table',  # 사진에서 확인한 구조
+    '//table'
+)]
+
+# 리포트 테이블의 데이터 행(td가 있는 행, 헤더 제외)과 행의 셀/링크
+_XP_REPORT_ROWS = etree.XPath('.//tr[td]')
+_XP_ROW_CELLS = etree.XPath('td')
+_XP_CELL_LINK = etree.XPath('.//a[@href]')
+
+# 리서치 리포트 상세 본문 선택자
+REPORT_CONTENT_SELECTORS = [sv.compile(selector) for selector in (
+    # 네이버 금융 리서치 리포트 구조
+    'div.view_cnt',  # 사진에서 확인한 구조
+    'td.view_cnt',
+    'div.report_content',
+    'div.research_content',
+    'div.content',
+    'div.article_content',
+    'div.view_content',
+    'div#content',
+    'div.summary',
+    'div.report_summary',
+
+    # 일반적인 본문 선택자
+    'div[class*="content"]',
+    'div[class*="view"]',
+    'td[class*="content"]',
+    'td[class*="view"]'
+)]
+
+# 리서치 리포트 본문 안에서 제거할 요소 선택자 (콤마 합집합 하나로 컴파일)
+REPORT_UNWANTED_SELECTOR = sv.compile(', '.join((
+    'script', 'style', 'iframe', 'noscript',
+    '.ad', '.advertise', '.advertisement',
+    '.related', '.comment', '.social',
+    'nav', 'header', 'footer',
+    '.link', '.btn', 'button',
+    '.print', '.share'
+)))
+
+# 네이버 뉴스 페이지의 원본 기사 링크 선택자 (selectolax 경로, 우선순위 순)
+ORIGINAL_LINK_SELECTORS = tuple(_css_ascii(selector) for selector in (
+    'a.media_end_head_origin_link',
+    'a[href*="originallink"]',
+    'a.link_news_origin',
+    '.press_logo a',
+    'a[title*="원문보기"]',
+    'a.media_end_head_origin'
+))
+
+# 발행일 요소 선택자 (네이버 뉴스 특화 우선)
+PUBLISH_DATE_CSS = ', '.join((
+    'span[data-date-time]',
+    'span.media_end_head_info_datestamp_time',
+    'span._ARTICLE_DATE_TIME',
+    '.media_end_head_info_datestamp_time',
+    'time[datetime]',
+    '.article_info .date',
+    '.byline .date',
+    '.news_end .date'
+))
+
+# 발행일 메타 태그 키 (property 또는 name 값, 우선순위 순)
+PUBLISH_DATE_META_KEYS = (
+    'article:published_time',
+    'pubdate',
+    'og:article:published_time',
+    'date'
+)
+
+# 네이버 뉴스 섹션 페이지의 기사 링크 후보 (헤드라인 → 최신 → 일반 제목 → 모든 기사 링크, 우선순위 순으로 조회)
+_XP_HEADLINE_GROUPS = tuple(etree.XPath(expression) for expression in (
+    f'//*[{_css_class("section_headline")}]//*[{_css_class("sa_text_title")}]',
+    f'//*[{_css_class("section_latest")}]//*[{_css_class("sa_text_title")}]',
+    f'//*[{_css_class("sa_text_title")}]',
+    '//a[contains(@href, "/article/")]',
+))
+
+
+def _headline_link(element):
+    """후보 요소가 속한 링크 - 자신이 <a>면 그대로, 아니면 가장 가까운 상위 <a>, 없으면 첫 하위 <a>"""
+    if element.tag == 'a':
+        return element
+    link = next(element.iterancestors('a'), None)
+    if link is None:
+        link = next(element.iterdescendants('a'), None)
+    return link
+
+# 네이버 뉴스 기사 페이지 선택자 (selectolax 경로)
+HEADLINE_TITLE_SELECTOR = "#title_area > span"
+HEADLINE_DATE_SELECTOR = "#ct > div.media_end_head.go_trans > div.media_end_head_info.nv_notrans > div.media_end_head_info_datestamp > div:nth-child(1) > span"
+# 발행일 대체 선택자 (적중 빈도 순)
+HEADLINE_DATE_FALLBACK_SELECTORS = (
+    '.media_end_head_info_datestamp_time',
+    'span[data-date-time]',
+    '.author em'
+)
+HEADLINE_BODY_SELECTOR = "#dic_area"
+# 본문에서 제거할 태그/네이버 뉴스 특화 요소를 합친 선택자 (한 번의 css 호출로 모두 수집)
+HEADLINE_BODY_STRIP_SELECTOR = ', '.join((
+    'script', 'style', 'iframe',
+    '.end_photo_org',
+    '.media_end_head_journalist',
+    '.media_end_summary',
+    'strong.media_end_summary'
+))
+
+# 헤드라인 기사 본문에서 이 문구부터 뒤는 잘라냄 (가장 먼저 나오는 문구 기준, 한 번의 검색)
+HEADLINE_UNWANTED_PHRASE_RE = re.compile('|'.join(map(re.escape, (
+    "무단전재 및 재배포 금지",
+    "저작권자",
+    "ⓒ",
+    "Copyright"
+))))
+
+HEADLINE_MEDIA_SELECTORS = (
+    '.media_end_head_top_logo img',
+    '.press_logo img',
+    '.media_end_head_top_logo_text'
+)
+
+# 구형 기사 레이아웃 본문 대체 선택자
+HEADLINE_BODY_FALLBACK_SELECTORS = (
+    '#articleBodyContents',
+    '.go_trans._article_content',
+    '._article_body_contents'
+)
+
+
+class _TokenBucket:
+    """여러 크롤링 스레드가 공유하는 토큰 버킷 (초당 rate개, 최대 burst개 누적)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def acquire(self):
+        """요청 토큰 하나를 가져오고, 없으면 다음 토큰이 채워질 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass(slots=True)
+class NewsItem:
+    """증권 메인 뉴스 한 건"""
+    title: str
+    link: str
+    content: str
+    publish_date: str
+    category: str
+    crawled_at: str
+
+
+@dataclass(slots=True)
+class ReportItem:
+    """리서치 리포트 한 건 (summary에는 상세 페이지 본문 저장)"""
+    title: str
+    link: str
+    summary: str
+    provider: str
+    publish_date: str
+    category_name: str
+    category_key: str
+    crawled_at: str
+
+
 class NaverStockNewsCrawler:
     """네이버 증권 뉴스 크롤러"""
 
     def __init__(self):
         self.base_url = "https://finance.naver.com"
+        # brotli 설치 시 urllib3가 br 응답을 자동 해제, max-age=0으로 조건부 GET(304) 재검증 유도
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Cache-Control': 'max-age=0'
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
 
-    def get_main_news(self, limit: int = 10) -> List[Dict]:
+        # 동시 상세 크롤링 + 원문 사이트 연결을 keep-alive로 재사용하도록 연결 풀 확장, 일시 오류는 짧게 재시도
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # 재실행 시 변경되지 않은 상세 페이지는 304 응답으로 재사용하기 위한 페이지 캐시
+        # (오래 쓰지 않은 페이지는 시작 시 삭제해 디렉터리가 무한히 커지지 않도록 함)
+        self.page_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.page_cache')
+        _prune_cache_dir(self.page_cache_dir, PAGE_CACHE_MAX_AGE, PAGE_CACHE_MAX_ENTRIES)
+
+        # 네이버 서버 부하 방지: 모든 크롤링 스레드가 공유하는 토큰 버킷 (초당 5개, 최대 5개 누적)
+        self._rate_limiter = _TokenBucket(rate=5.0, burst=5)
+
+        # 카테고리 간 중복 등장하는 상세 페이지를 다시 받지 않도록 정규화 URL 기준으로 결과 보관
+        self._news_detail_cache: Dict[str, Dict] = {}
+        self._report_content_cache: Dict[str, str] = {}
+
+    def _get_news_detail_cached(self, link: str) -> Dict:
+        """정규화 URL 기준으로 메모이즈한 _get_news_detail"""
+        key = _canonical_url(link)
+        cached = self._news_detail_cache.get(key)
+        if cached is not None:
+            return cached
+        detail = self._get_news_detail(link)
+        # 실패(빈 본문)는 저장하지 않아 다음 등장 시 다시 시도
+        if detail.get('content'):
+            self._news_detail_cache[key] = detail
+        return detail
+
+    def _get_research_report_content_cached(self, link: str) -> str:
+        """정규화 URL 기준으로 메모이즈한 _get_research_report_content"""
+        key = _canonical_url(link)
+        cached = self._report_content_cache.get(key)
+        if cached is not None:
+            return cached
+        content = self._get_research_report_content(link)
+        # 실패(빈 본문)는 저장하지 않아 다음 등장 시 다시 시도
+        if content:
+            self._report_content_cache[key] = content
+        return content
+
+    def _conditional_get(self, url: str, timeout: int = 15, rate_limited: bool = True) -> bytes:
+        """
+        ETag/Last-Modified 조건부 GET - 304면 캐시된 본문, 200이면 새 본문을 캐시에 저장 후 반환
+
+        Args:
+            url: 요청 URL
+            timeout: 요청 타임아웃(초)
+            rate_limited: 네이버 토큰 버킷 적용 여부 (외부 언론사 원문은 False)
+
+        Returns:
+            bytes: 응답 본문
+        """
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        meta_path = os.path.join(self.page_cache_dir, f"{key}.json")
+        body_path = os.path.join(self.page_cache_dir, f"{key}.html")
+
+        headers = {}
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        except (OSError, ValueError):
+            pass
+
+        if rate_limited:
+            self._rate_limiter.acquire()
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            try:
+                with open(body_path, 'rb') as f:
+                    logger.info(f"변경 없음(304) - 캐시된 페이지 사용: {url}")
+                    body = f.read()
+                # 계속 쓰이는 페이지는 정리 대상에서 빠지도록 사용 시각 갱신
+                os.utime(body_path)
+                return body
+            except OSError:
+                # 캐시 본문이 사라진 경우 조건 없이 다시 요청
+                if rate_limited:
+                    self._rate_limiter.acquire()
+                response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            try:
+                os.makedirs(self.page_cache_dir, exist_ok=True)
+                with open(body_path, 'wb') as f:
+                    f.write(response.content)
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump({'url': url, 'etag': etag, 'last_modified': last_modified}, f)
+            except OSError as e:
+                logger.warning(f"페이지 캐시 저장 실패: {e}")
+
+        return response.content
+
+    def _soup(self, content: bytes) -> BeautifulSoup:
+        """
+        응답 바이트를 lxml(C 파서) 기반 BeautifulSoup 객체로 변환
+
+        Args:
+            content: HTTP 응답 본문 바이트
+
+        Returns:
+            BeautifulSoup: 파싱된 문서
+        """
+        # 네이버 금융은 EUC-KR, 뉴스/외부 원문은 UTF-8 등 제각각이므로 인코딩은 문서의 meta 선언에 맡김
+        return BeautifulSoup(content, 'lxml')
+
+    def get_main_news(self, limit: int = 10) -> List[NewsItem]:
         """
         네이버 증권 메인 뉴스 크롤링
 
@@ -34,45 +607,35 @@ class NaverStockNewsCrawler:
             limit: 가져올 뉴스 개수
 
         Returns:
-            List[Dict]: 뉴스 정보 리스트
+            List[NewsItem]: 뉴스 정보 리스트
         """
         news_list = []
+        # 수집 시각은 크롤링 실행 단위로 한 번만 계산
+        now_iso = datetime.now().isoformat()
 
         try:
             # 네이버 증권 뉴스 페이지 URL
             url = "https://finance.naver.com/news/"
+            self._rate_limiter.acquire()
             response = self.session.get(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self._soup(response.content)
 
             # 네이버 증권 뉴스 페이지의 다양한 선택자 시도
-            news_selectors = [
-                '.newslist .articleSubject a',  # 뉴스 리스트의 기사 제목
-                '.newsList .articleSubject a',
-                '.articleSubject a',            # 기본 기사 제목
-                '.news_list .subject a',        # 뉴스 리스트 제목
-                '.type2 .subject a',            # type2 스타일의 제목
-                '.headline_list .subject a',    # 헤드라인 리스트
-                '.articleSubject',              # 제목 요소 자체
-                'td.subject a',                 # 테이블 형태의 제목
-                '.tb_type1 .subject a',         # 테이블 type1의 제목
-                'a[href*="news_read"]',         # 뉴스 읽기 링크 포함
-            ]
-
             news_items = []
             found_selector = None
 
-            for selector in news_selectors:
+            for selector in NEWS_LIST_SELECTORS:
                 try:
-                    items = soup.select(selector)
+                    items = selector.select(soup)
                     if items and len(items) >= 5:  # 최소 5개 이상의 뉴스가 있어야 유효
                         news_items = items[:limit]
-                        found_selector = selector
+                        found_selector = selector.pattern
                         logger.info(f"뉴스 리스트 발견: {len(news_items)}개")
                         break
                 except Exception as e:
-                    logger.error(f"선택자 '{selector}' 시도 중 오류: {e}")
+                    logger.error(f"선택자 '{selector.pattern}' 시도 중 오류: {e}")
                     continue
 
             if not news_items:
@@ -98,8 +661,9 @@ class NaverStockNewsCrawler:
                     logger.warning("뉴스 리스트를 찾을 수 없습니다.")
                     return news_list
 
-            # 뉴스 항목 처리
-            for idx, item in enumerate(news_items):
+            # 뉴스 항목 처리 - 1단계: 제목/링크 후보 수집
+            candidates = []
+            for item in news_items:
                 try:
                     # 링크 요소 확인
                     if item.name == 'a':
@@ -126,37 +690,33 @@ class NaverStockNewsCrawler:
                             # 프로토콜이 없는 경우
                             link = "https://finance.naver.com/" + link.lstrip('/')
 
-                    # 상세 뉴스 내용 ���롤링 (에러가 발생해도 계속 진행)
-                    try:
-                        news_detail = self._get_news_detail(link)
-                    except Exception as detail_error:
-                        logger.warning(f"뉴스 상세 크롤링 실패 ('{title}'): {detail_error}")
-                        news_detail = {'content': '', 'publish_date': ''}
-
-                    news_data = {
-                        'title': title,
-                        'link': link,
-                        'content': news_detail.get('content', ''),
-                        'full_html': news_detail.get('full_html', ''),  # HTML 전체 내용 추가
-                        'publish_date': news_detail.get('publish_date', ''),
-                        'category': 'main_news',
-                        'crawled_at': datetime.now().isoformat()
-                    }
-
-                    news_list.append(news_data)
-                    logger.info(f"뉴스 수집 ({len(news_list)}/{limit}): '{title[:50]}...'")
+                    candidates.append((title, link))
 
                     # 원하는 개수에 도달하면 중단
-                    if len(news_list) >= limit:
+                    if len(candidates) >= limit:
                         break
 
-                    # 서버 부하 방지를 위한 딜레이
-                    time.sleep(0.5)  # 딜레이 단축
-
                 except Exception as e:
                     logger.error(f"뉴스 항목 처리 중 오류: {e}")
                     continue
 
+            # 2단계: 상세 뉴스 내용 동시 크롤링 (_get_news_detail은 실패 시 빈 결과 반환)
+            with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+                details = executor.map(self._get_news_detail_cached, [link for _, link in candidates])
+
+                for (title, link), news_detail in zip(candidates, details):
+                    news_data = NewsItem(
+                        title=title,
+                        link=link,
+                        content=news_detail.get('content', ''),
+                        publish_date=news_detail.get('publish_date', ''),
+                        category='main_news',
+                        crawled_at=now_iso
+                    )
+
+                    news_list.append(news_data)
+                    logger.info(f"뉴스 수집 ({len(news_list)}/{limit}): '{title[:50]}...'")
+
             logger.info(f"뉴스 크롤링 완료: 총 {len(news_list)}개 수집")
 
         except Exception as e:
@@ -164,7 +724,7 @@ class NaverStockNewsCrawler:
 
         return news_list
 
-    def get_research_reports(self, limit: int = 10) -> List[Dict]:
+    def get_research_reports(self, limit: int = 10) -> List[ReportItem]:
         """
         네이버 증권 리서치 리포트 크롤링 - 개선된 버전
         https://finance.naver.com/research/ 메인 페이지에서 각 카테고리별 최신 리포트 수집
@@ -173,9 +733,11 @@ class NaverStockNewsCrawler:
             limit: 각 카테고리별로 가져올 리�������������트 개수
 
         Returns:
-            List[Dict]: 리포트 정보 리스트
+            List[ReportItem]: 리포트 정보 리스트
         """
         all_reports = []
+        # 수집 시각은 크롤링 실행 단위로 한 번만 계산
+        now_iso = datetime.now().isoformat()
 
         # 네이버 금융 리서치 메인 페이지
         main_research_url = "https://finance.naver.com/research/"
@@ -194,47 +756,37 @@ class NaverStockNewsCrawler:
             try:
                 logger.info(f"{category_name} 리포트 크롤링 시작... ({category_url})")
 
+                self._rate_limiter.acquire()
                 response = self.session.get(category_url, timeout=10)
                 response.raise_for_status()
 
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # 리포트 테이블 찾기 - 네이버 금융 리서치 구조에 맞는 선택자
-                table_selectors = [
-                    'table.type_1',  # 주로 사용되는 테이블 클래스
-                    'table.type_2',
-                    'table[summary*="리포트"]',
-                    'div.box_type_m table',  # 사진에서 확인한 구조
-                    'table'
-                ]
+                doc = lxml_html.fromstring(response.content)
 
+                # 리포트 테이블 찾기 - 헤더 외에 데이터 행이 있는 첫 테이블
                 table = None
-                for selector in table_selectors:
-                    table = soup.select_one(selector)
-                    if table and len(table.find_all('tr')) > 1:  # 헤더 외에 데이터가 있���지 확인
-                        logger.info(f"{category_name} 리포트 테이블 발견 (선택자: {selector})")
+                data_rows = []
+                for xpath in REPORT_TABLE_XPATHS:
+                    for candidate_table in xpath(doc):
+                        data_rows = _XP_REPORT_ROWS(candidate_table)
+                        if data_rows:
+                            table = candidate_table
+                            break
+                    if table is not None:
+                        logger.info(f"{category_name} 리포트 테이블 발견 (XPath: {xpath.path})")
                         break
 
-                if not table:
+                if table is None:
                     logger.warning(f"{category_name}: 리포트 테이블을 찾을 수 없습니다.")
                     continue
 
-                # 테이블의 모든 행 추출
-                rows = table.find_all('tr')
-                if len(rows) <= 1:
-                    logger.warning(f"{category_name}: 데이터 행이 없습니다.")
-                    continue
-
-                # 헤더 행 제외
-                data_rows = rows[1:] if rows[0].find('th') else rows
-
-                count = 0
+                # 1단계: 행에서 제목/링크/날짜/제공자 후보 수집
+                candidates = []
 
                 for row in data_rows:
-                    if count >= limit:
+                    if len(candidates) >= limit:
                         break
 
-                    cells = row.find_all('td')
+                    cells = _XP_ROW_CELLS(row)
                     if len(cells) < 2:  # 최소 2개 셀 필요 (제목, 날짜 등)
                         continue
 
@@ -245,10 +797,10 @@ class NaverStockNewsCrawler:
 
                         # 첫 번째 또는 두 번째 셀에서 링크 찾기
                         for cell in cells[:3]:  # 처음 3개 셀에서 찾기
-                            a_tag = cell.find('a')
-                            if a_tag and a_tag.get('href'):
-                                title = a_tag.get_text(strip=True)
-                                link = a_tag.get('href')
+                            a_tags = _XP_CELL_LINK(cell)
+                            if a_tags:
+                                title = a_tags[0].text_content().strip()
+                                link = a_tags[0].get('href')
 
                                 # 제목이 의미있는지 확인
                                 if len(title) > 5 and not title.isdigit():
@@ -263,54 +815,47 @@ class NaverStockNewsCrawler:
                         elif not link.startswith('http'):
                             link = f"https://finance.naver.com/research/{link}"
 
-                        # 발행일 추출 - 보통 마지막 셀들에서 찾을 수 있음
-                        publish_date = ""
-                        for cell in reversed(cells):
-                            cell_text = cell.get_text(strip=True)
-                            # 날짜 패턴 확인 (YY.MM.DD, YYYY.MM.DD 등)
-                            if self._is_valid_date(cell_text):
-                                publish_date = cell_text
-                                break
+                        # 셀 텍스트를 탭으로 이어 붙여 발행일/제공자를 한 번씩만 검색
+                        row_text = '\t'.join(cell.text_content().strip() for cell in cells)
+
+                        # 발행일 추출 - 보통 마지막 셀에 있으므로 마지막 매치 사용
+                        dates = DATE_RE.findall(row_text)
+                        publish_date = dates[-1] if dates else ""
 
                         # 증권사/제공자 정보 추출
-                        provider = ""
-                        for cell in cells:
-                            cell_text = cell.get_text(strip=True)
-                            if any(keyword in cell_text for keyword in ['증권', '투자', '자산', '캐피탈', 'Securities']):
-                                provider = cell_text
-                                break
+                        provider_match = PROVIDER_RE.search(row_text)
+                        provider = provider_match.group(0) if provider_match else ""
 
-                        # 리포트 상세 페이지에서 실제 본문 추출
-                        content = self._get_research_report_content(link)
+                        candidates.append((title, link, publish_date, provider))
 
-                        report_data = {
-                            'title': title,
-                            'link': link,
-                            'summary': content,  # 실제 리포트 본문을 summary로 저장
-                            'provider': provider,
-                            'publish_date': publish_date if publish_date else 'unknown',
-                            'category_name': category_name,
-                            'category_key': category_name.lower(),
-                            'crawled_at': datetime.now().isoformat()
-                        }
+                    except Exception as e:
+                        logger.error(f"{category_name} 리포트 처리 중 오류: {e}")
+                        continue
+
+                # 2단계: 리포트 상세 페이지에서 실제 본문 동시 추출
+                count = 0
+                with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+                    contents = executor.map(self._get_research_report_content_cached, [c[1] for c in candidates])
+
+                    for (title, link, publish_date, provider), content in zip(candidates, contents):
+                        report_data = ReportItem(
+                            title=title,
+                            link=link,
+                            summary=content,  # 실제 리포트 본문을 summary로 저장
+                            provider=provider,
+                            publish_date=publish_date if publish_date else 'unknown',
+                            category_name=category_name,
+                            category_key=category_name.lower(),
+                            crawled_at=now_iso
+                        )
 
                         all_reports.append(report_data)
                         count += 1
 
                         logger.info(f"{category_name}: '{title}' 리포트 수집 완료 ({count}/{limit})")
 
-                        # 서버 부하 방지
-                        time.sleep(1)
-
-                    except Exception as e:
-                        logger.error(f"{category_name} 리포트 처리 중 오류: {e}")
-                        continue
-
                 logger.info(f"{category_name}: {count}개 리포트 수집 완료")
 
-                # 카테고리 간 딜레이
-                time.sleep(2)
-
             except Exception as e:
                 logger.error(f"{category_name} 카테고리 크롤링 중 ���류: {e}")
                 continue
@@ -328,82 +873,41 @@ class NaverStockNewsCrawler:
             str: 리포트 본문 내용
         """
         try:
-            response = self.session.get(link, timeout=15)
-            response.raise_for_status()
+            html = self._conditional_get(link, timeout=15)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self._soup(html)
 
             # 리포트 본문을 위한 다양한 선택자 시도
-            content_selectors = [
-                # 네이버 금융 리서치 리포트 구조
-                'div.view_cnt',  # 사진에서 확인한 구조
-                'td.view_cnt',
-                'div.report_content',
-                'div.research_content',
-                'div.content',
-                'div.article_content',
-                'div.view_content',
-                'div#content',
-                'div.summary',
-                'div.report_summary',
-
-                # 일반적인 본문 선택자
-                'div[class*="content"]',
-                'div[class*="view"]',
-                'td[class*="content"]',
-                'td[class*="view"]'
-            ]
-
             content = ""
 
-            for selector in content_selectors:
+            for selector in REPORT_CONTENT_SELECTORS:
                 try:
-                    content_div = soup.select_one(selector)
+                    content_div = selector.select_one(soup)
                     if content_div:
                         # 불필요한 요소 제거
-                        unwanted_selectors = [
-                            'script', 'style', 'iframe', 'noscript',
-                            '.ad', '.advertise', '.advertisement',
-                            '.related', '.comment', '.social',
-                            'nav', 'header', 'footer',
-                            '.link', '.btn', 'button',
-                            '.print', '.share'
-                        ]
-
-                        for unwanted_selector in unwanted_selectors:
-                            for unwanted in content_div.select(unwanted_selector):
-                                unwanted.decompose()
+                        for unwanted in REPORT_UNWANTED_SELECTOR.select(content_div):
+                            unwanted.decompose()
 
                         # 텍스트 추출
                         text = content_div.get_text(separator=' ', strip=True)
 
                         # 연속된 공백 정리
-                        import re
-                        text = re.sub(r'\s+', ' ', text).strip()
+                        text = ' '.join(text.split())
 
                         # 네이버 거래연결 관련 불��요한 텍스트 제거
-                        unwanted_phrases = [
-                            "네이버 주식거래연결",
-                            "빠른 주문을 도와드립니다",
-                            "증권사의 로그인을 연결",
-                            "네이버는 증권사 서비스의 시스템 장���에 따른 법적 책임을 지지 않습니다"
-                        ]
-
-                        for phrase in unwanted_phrases:
-                            if phrase in text:
-                                # 이런 문구가 포함된 경우 다른 선택자 시도
-                                text = ""
-                                break
+                        # 네이버 거래연결 안내 문구가 포함된 경우 다른 선택자 시도 (한 번의 검색으로 모든 문구 확인)
+                        if REPORT_BLOCKED_PHRASE_RE.search(text):
+                            text = ""
 
                         # 의미있는 길이의 본문인지 확인
                         if len(text) > 100:
-                            logger.info(f"리포트 본문 추출 성공 (선택자: {selector}, 길이: {len(text)}자)")
+                            logger.info(f"리포트 본문 추출 성공 (선택자: {selector.pattern}, 길이: {len(text)}자)")
                             logger.info(f"본문 미리보기: {text[:200]}...")
                             content = text
                             break
 
                 except Exception as e:
-                    logger.warning(f"선택자 '{selector}' 처리 중 오류: {e}")
+                    logger.warning(f"선택자 '{selector.pattern}' 처리 중 오류: {e}")
                     continue
 
             # 선택자로 찾지 못한 경우 p 태그들 결합
@@ -415,14 +919,11 @@ class NaverStockNewsCrawler:
                         for p in paragraphs:
                             p_text = p.get_text(strip=True)
                             # 불필요한 내용 필터링
-                            if (len(p_text) > 20 and
-                                not any(unwanted in p_text for unwanted in
-                                       ['주식거래연결', '로그인을 연결', '법적 책임', '시스템 장애'])):
+                            if len(p_text) > 20 and not REPORT_PARAGRAPH_SKIP_RE.search(p_text):
                                 paragraph_texts.append(p_text)
 
                         if paragraph_texts:
-                            content = ' '.join(paragraph_texts)
-                            content = re.sub(r'\s+', ' ', content).strip()
+                            content = ' '.join(' '.join(paragraph_texts).split())
                             logger.info(f"p태그 결합으로 리포트 ��문 추출 (길이: {len(content)}자)")
 
                 except Exception as e:
@@ -442,15 +943,17 @@ class NaverStockNewsCrawler:
             link: 뉴스 링크
 
         Returns:
-            Dict: 뉴스 내용(전체 본문), HTML 컨텐츠, 발행일 등 정보
+            Dict: 뉴스 내용(전체 본문), 발행일 정보
         """
         try:
             logger.info(f"뉴스 상세 크롤링 시작: {link}")
 
             # 네이버 뉴스 페이지 접근
-            response = self.session.get(link, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            html = self._conditional_get(link, timeout=15)
+            # 인코딩은 meta 선언으로, 원본 링크/발행일은 selectolax 트리로 조회
+            # (BeautifulSoup 트리는 빠른 본문 추출 경로가 모두 실패했을 때만 생성)
+            encoding = _sniff_encoding(html)
+            tree = LexborHTMLParser(html.decode(encoding, errors='replace'))
 
             # 먼저 네이버 뉴스인지 확인
             is_naver_news = 'news.naver.com' in link or 'finance.naver.com' in link
@@ -459,20 +962,11 @@ class NaverStockNewsCrawler:
                 logger.info("네이버 뉴스 페이지로 확인됨")
 
                 # 원본 기사 링크 찾기 시도
-                original_link_selectors = [
-                    'a.media_end_head_origin_link',
-                    'a[href*="originallink"]',
-                    'a.link_news_origin',
-                    '.press_logo a',
-                    'a[title*="원문보기"]',
-                    'a.media_end_head_origin'
-                ]
-
                 original_url = ""
-                for selector in original_link_selectors:
-                    original_link_elem = soup.select_one(selector)
-                    if original_link_elem and original_link_elem.get('href'):
-                        original_url = original_link_elem['href']
+                for selector in ORIGINAL_LINK_SELECTORS:
+                    original_link_elem = tree.css_first(selector)
+                    if original_link_elem is not None and original_link_elem.attributes.get('href'):
+                        original_url = original_link_elem.attributes['href']
                         logger.info(f"원본 기사 링크 발견: {original_url}")
                         break
 
@@ -480,38 +974,51 @@ class NaverStockNewsCrawler:
                 if original_url and original_url.startswith('http') and 'naver.com' not in original_url:
                     try:
                         logger.info("원본 기사에서 본문 추출 시도")
-                        original_response = self.session.get(original_url, timeout=15)
-                        original_response.raise_for_status()
-                        original_soup = BeautifulSoup(original_response.content, 'html.parser')
-
-                        content = self._extract_content_from_soup(original_soup, "원본 기사")
+                        # 원문도 조건부 GET으로 받아 변경 없는 기사는 304로 본문 전송 생략
+                        original_html = self._conditional_get(original_url, timeout=15, rate_limited=False)
+                        original_tree = LexborHTMLParser(
+                            original_html.decode(_sniff_encoding(original_html), errors='replace')
+                        )
+                        # 본문 추출이 트리에서 헤더/바이라인을 제거하기 전에 발행일 조회
+                        original_date = self._extract_publish_date(original_tree, original_url)
+
+                        # selectolax로 찾지 못했을 때만 BeautifulSoup으로 다시 파싱
+                        content = self._extract_content_fast(original_tree, "원본 기사")
+                        if not content:
+                            content = self._extract_content_from_soup(self._soup(original_html), "원본 기사")
                         if content and len(content) > 100:
-                            publish_date = self._extract_publish_date_from_soup(original_soup, original_url)
+                            # 원문에 발행일이 없으면 이미 파싱한 네이버 페이지에서 보충
+                            publish_date = original_date or self._extract_publish_date(tree, link)
                             return {
                                 'content': content,
-                                'full_html': '',
                                 'publish_date': publish_date
                             }
                     except Exception as e:
                         logger.warning(f"원본 기사 처리 실패: {e}")
 
-            # 네이버 뉴스 페이지에서 직접 추출
+            # 발행일 추출
+            publish_date = self._extract_publish_date(tree, link)
+
+            # 원문 실패 시 재요청 없이 네이버 페이지에서 직접 추출
+            # (원시 바이트 스트리밍 → selectolax → 둘 다 실패했을 때만 BeautifulSoup)
             logger.info("네이버 뉴스 페이지에서 직접 본문 추출 시도")
-            content = self._extract_content_from_soup(soup, "네이버 뉴스")
+            content = (self._extract_naver_article_streaming(html, encoding)
+                       or self._extract_content_fast(tree, "네이버 뉴스"))
 
-            # 발행일 추출
-            publish_date = self._extract_publish_date_from_soup(soup, link)
+            soup = None
+            if not content:
+                soup = self._soup(html)
+                content = self._extract_content_from_soup(soup, "네이버 뉴스")
 
             # 본문이 너무 짧으면 대안 방법 시도
             if not content or len(content) < 30:
                 logger.info("대안적 방법으로 본문 추출 시도")
-                content = self._extract_content_alternative(soup, link)
+                content = self._extract_content_alternative(soup or self._soup(html), link)
 
             logger.info(f"본문 추출 완료 - 길이: {len(content)}자")
 
             return {
                 'content': content,
-                'full_html': '',
                 'publish_date': publish_date
             }
 
@@ -519,165 +1026,153 @@ class NaverStockNewsCrawler:
             logger.warning(f"뉴스 상세 크롤링 중 오류 ({link}): {e}")
             return {
                 'content': '',
-                'full_html': '',
                 'publish_date': ''
             }
 
-    def _extract_content_from_soup(self, soup: BeautifulSoup, source_type: str) -> str:
+    def _clean_article_text(self, text: str) -> str:
         """
-        BeautifulSoup 객체에서 본문 내용 추출 - 네이버 뉴스 HTML 구조 기반
+        줄 단위로 추출한 본문 텍스트를 한 줄로 정리하고 저작권 등 꼬리 문구 제거
 
         Args:
-            soup: BeautifulSoup 객체
+            text: 줄바꿈 구분자로 추출한 원문 텍스트
+
+        Returns:
+            str: 정리된 본문
+        """
+        # 빈 줄 제거와 연속 공백 정리를 split/join 한 번으로 처리 (줄바꿈도 공백으로 취급)
+        text = ' '.join(text.split())
+
+        # 네이버 특화 불필요 문구 제거 (가장 먼저 나오는 문구 이후 부분 제거)
+        unwanted = ARTICLE_UNWANTED_PHRASE_RE.search(text)
+        if unwanted:
+            text = text[:unwanted.start()].strip()
+
+        return text
+
+    def _extract_naver_article_streaming(self, html: bytes, encoding: str) -> str:
+        """
+        lxml 풀 파서로 네이버 뉴스 본문 컨테이너(#dic_area/#newsct_article)가 닫히는 순간까지만 파싱해 본문 추출
+        - 컨테이너 이후의 페이지는 트리를 만들지 않음, 찾지 못하면 빈 문자열
+
+        Args:
+            html: HTTP 응답 본문 바이트
+            encoding: 문서 인코딩
+
+        Returns:
+            str: 추출된 본문 내용
+        """
+        try:
+            parser = etree.HTMLPullParser(events=('end',), encoding=encoding or 'utf-8')
+            for offset in range(0, len(html), STREAM_CHUNK_SIZE):
+                parser.feed(html[offset:offset + STREAM_CHUNK_SIZE])
+                for _, element in parser.read_events():
+                    if element.get('id') not in NAVER_ARTICLE_IDS:
+                        continue
+
+                    etree.strip_elements(element, 'script', 'style', 'iframe', 'noscript', with_tail=False)
+                    for node in _XP_ARTICLE_UNWANTED(element):
+                        # 요소만 제거하고 뒤따르는 텍스트(tail)는 보존
+                        parent = node.getparent()
+                        if parent is None:
+                            continue
+                        if node.tail:
+                            previous = node.getprevious()
+                            if previous is not None:
+                                previous.tail = (previous.tail or '') + node.tail
+                            else:
+                                parent.text = (parent.text or '') + node.tail
+                        parent.remove(node)
+
+                    text = self._clean_article_text('\n'.join(element.itertext()))
+                    if len(text) > 30:
+                        logger.info(f"네이버 뉴스 본문 스트리밍 추출 성공 (#{element.get('id')}, 길이: {len(text)}자)")
+                        return text
+        except Exception as e:
+            logger.warning(f"스트리밍 본문 추출 중 오류: {e}")
+
+        return ""
+
+    def _extract_content_fast(self, tree: LexborHTMLParser, source_type: str) -> str:
+        """
+        selectolax(C 기반 CSS 엔진)로 본문 추출 - 실패 시 빈 문자열 (BeautifulSoup 경로로 대체)
+        본문 안의 불필요 요소를 트리에서 직접 제거하므로 같은 트리의 다른 조회는 먼저 수행할 것
+
+        Args:
+            tree: 이미 파싱한 selectolax(lexbor) 트리
             source_type: 소스 타입 (로깅용)
 
         Returns:
             str: 추출된 본문 내용
         """
-        content = ""
+        try:
+            for selector in ARTICLE_CONTENT_SELECTORS:
+                node = tree.css_first(selector)
+                if node is None:
+                    continue
 
-        # 디버깅을 위한 HTML 구조 확인
-        logger.info(f"{source_type} HTML 구조 분석 시작")
+                _decompose_outermost(node.css(ARTICLE_UNWANTED_CSS))
+
+                text = self._clean_article_text(node.text(separator='\n', strip=True))
+                if len(text) > 30:
+                    logger.info(f"{source_type}에서 본문 추출 성공 (selectolax, 선택자: {selector}, 길이: {len(text)}자)")
+                    return text
+        except Exception as e:
+            logger.warning(f"selectolax 본문 추출 중 오류: {e}")
 
-        # 페이지에 있는 모든 article 태그 찾기
-        articles = soup.find_all('article')
-        logger.info(f"발견된 article 태그 수: {len(articles)}")
+        return ""
 
-        for i, article in enumerate(articles):
-            article_id = article.get('id', 'no-id')
-            article_class = article.get('class', [])
-            logger.info(f"Article {i+1}: id='{article_id}', class='{article_class}'")
+    def _extract_content_from_soup(self, soup: BeautifulSoup, source_type: str) -> str:
+        """
+        BeautifulSoup 객체에서 본문 내용 추출 - 네이버 뉴스 HTML 구조 기반
 
-            # dic_area를 찾았다면 내부 구조 확인
-            if 'dic_area' in article_id:
-                logger.info(f"dic_area 발견! 내부 요소 확인")
-                # 모든 하위 요소들 확인
-                children = article.find_all(['p', 'div', 'span', 'strong'])
-                logger.info(f"dic_area 내부 요소 수: {len(children)}")
+        Args:
+            soup: BeautifulSoup 객체
+            source_type: 소스 타입 (로깅용)
 
-                for j, child in enumerate(children[:10]):  # 처음 10개만 확인
-                    child_tag = child.name
-                    child_class = child.get('class', [])
-                    child_text = child.get_text(strip=True)[:50]  # 처음 50자���
-                    logger.info(f"  Child {j+1}: <{child_tag}> class='{child_class}' text='{child_text}...'")
+        Returns:
+            str: 추출된 본문 내용
+        """
+        content = ""
+
+        # 상세 구조 로그는 DEBUG 레벨에서만 계산
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         # 사진에서 확인한 정확한 네이버 뉴스 구조를 우선으로 시도
-        content_selectors = [
-            # 사진에서 확인한 정확한 네이버 뉴스 구조
-            'article#dic_area.go_trans._article_content',
-            'article#dic_area',
-            'div#dic_area',
-
-            # 네이버 뉴스 본문 컨테이너의 다양한 패턴
-            'div#newsct_article',
-            'div.newsct_article',
-            'div#contents div#newsct_article',
-            'div.newsct_body',
-            'div#contents.newsct_body div#newsct_article',
-
-            # 일반적인 뉴스 사이트 패턴
-            'div#articleBodyContents',
-            'article.article-body',
-            'div.article-body',
-            'div.news-content',
-            'div.article-content',
-            'div.content-body',
-            'div.post-content',
-            'div.entry-content',
-
-            # 더 일반적인 패턴
-            'div[class*="content"]',
-            'div[class*="article"]',
-            'div[id*="content"]',
-            'div[id*="article"]',
-            'main',
-            'section[class*="content"]'
-        ]
-
-        for selector in content_selectors:
+        for selector in ARTICLE_CONTENT_SOUP_SELECTORS:
             try:
-                content_div = soup.select_one(selector)
+                content_div = selector.select_one(soup)
                 if content_div:
-                    logger.info(f"{source_type}에서 선택자 '{selector}' 발견")
-
-                    # 내부 요소들 확인
-                    all_elements = content_div.find_all()
-                    logger.info(f"선택된 요소 내부에 {len(all_elements)}개 하위 요소 발견")
+                    if debug_enabled:
+                        logger.debug(f"{source_type}에서 선택자 '{selector.pattern}' 발견 (하위 요소 {len(content_div.find_all())}개)")
 
                     # 네이버 뉴스 특화 불필요 요소 제거
-                    unwanted_selectors = [
-                        'script', 'style', 'iframe', 'noscript',
-                        '.ad', '.advertise', '.advertisement',
-                        '.related', '.comment', '.social',
-                        'nav', 'header', 'footer', '.sidebar',
-                        '.media_end_head', '.byline', '.copyright',
-                        '.journalist', '.reporter_info',
-                        '.end_photo_org',  # 사진 설명 제거
-                        '.media_end_head_info',  # 헤더 정보 제거
-                        '.media_end_head_journalist',  # 기자 정보 제거
-                        'span.end_photo_org',  # 사진 관련 span 제거
-                        '.media_end_summary',  # 요약 제거
-                        'strong.media_end_summary'  # 요약 제거
-                    ]
-
                     removed_count = 0
-                    for unwanted_selector in unwanted_selectors:
-                        unwanted_elements = content_div.select(unwanted_selector)
-                        for unwanted in unwanted_elements:
-                            unwanted.decompose()
-                            removed_count += 1
+                    for unwanted in ARTICLE_UNWANTED_SOUP_SELECTOR.select(content_div):
+                        unwanted.decompose()
+                        removed_count += 1
 
-                    logger.info(f"불필요한 요소 {removed_count}개 제거")
-
-                    # 텍스트 추출 전에 남은 요소들 확인
-                    remaining_elements = content_div.find_all()
-                    logger.info(f"정리 후 남은 요소 수: {len(remaining_elements)}")
+                    if debug_enabled:
+                        logger.debug(f"불필요한 요소 {removed_count}개 제거")
 
                     # 남은 요소들의 텍스트 길이 확인
                     total_text = content_div.get_text(strip=True)
-                    logger.info(f"전체 텍스트 길이: {len(total_text)}자")
 
                     if len(total_text) > 20:
                         # 텍스트 추출 - 줄바꿈을 유지하면서 추출
-                        text = content_div.get_text(separator='\n', strip=True)
-
-                        # 빈 줄 제거하고 한 줄로 정리
-                        lines = [line.strip() for line in text.split('\n') if line.strip()]
-                        text = ' '.join(lines)
-
-                        # 연속된 공백 정리
-                        import re
-                        text = re.sub(r'\s+', ' ', text).strip()
-
-                        # 네이버 특화 불필요 문구 제거
-                        unwanted_phrases = [
-                            "무단전재 및 재배포 금지",
-                            "저작권자",
-                            "ⓒ",
-                            "Copyright",
-                            "All rights reserved",
-                            "본 기사는",
-                            "기자 "
-                        ]
-
-                        for phrase in unwanted_phrases:
-                            if phrase in text:
-                                # 해당 문구 이후 부분 제거
-                                text = text.split(phrase)[0].strip()
+                        text = self._clean_article_text(content_div.get_text(separator='\n', strip=True))
 
                         # 최소 길이 체크 (의미있는 뉴스 본문이어야 함)
                         if len(text) > 30:  # 최소 30자 이상으로 낮춤
-                            logger.info(f"{source_type}에서 본문 추출 성공 (선택자: {selector}, 길이: {len(text)}자)")
-                            logger.info(f"본문 미리보기: {text[:200]}...")
+                            logger.info(f"{source_type}에서 본문 추출 성공 (선택자: {selector.pattern}, 길이: {len(text)}자)")
                             content = text
                             break
-                        else:
-                            logger.info(f"추출된 텍스트가 너무 짧음: {len(text)}자")
-                    else:
-                        logger.info(f"선택된 요소에 텍스트가 거의 없음: {len(total_text)}자")
+                        elif debug_enabled:
+                            logger.debug(f"추출된 텍스트가 너무 짧음: {len(text)}자")
+                    elif debug_enabled:
+                        logger.debug(f"선택된 요소에 텍스트가 거의 없음: {len(total_text)}자")
 
             except Exception as e:
-                logger.warning(f"선택자 '{selector}' 처리 중 오류: {e}")
+                logger.warning(f"선택자 '{selector.pattern}' 처리 중 오류: {e}")
                 continue
 
         # 선택자로 찾지 못한 경우 더 적극적인 방법 시도
@@ -687,7 +1182,6 @@ class NaverStockNewsCrawler:
 
                 # 모든 p, div, span 태그에서 텍스트 수집
                 all_text_elements = soup.find_all(['p', 'div', 'span'])
-                logger.info(f"전체 텍스트 요소 수: {len(all_text_elements)}")
 
                 meaningful_texts = []
                 for element in all_text_elements:
@@ -701,20 +1195,17 @@ class NaverStockNewsCrawler:
                         ])):
                         meaningful_texts.append(element_text)
 
-                logger.info(f"의미���는 텍스트 요소 수: {len(meaningful_texts)}")
+                if debug_enabled:
+                    logger.debug(f"의미있는 텍스트 요소 수: {len(meaningful_texts)}")
 
                 if meaningful_texts:
-                    # 가장 긴 텍스트들을 조합 (최대 5개)
-                    sorted_texts = sorted(meaningful_texts, key=len, reverse=True)
-                    content = ' '.join(sorted_texts[:5])
-
+                    # 가장 긴 텍스트들을 조합 (최대 5개, 전체 정렬 없이 상위 5개만 선택)
+                    longest_texts = heapq.nlargest(5, meaningful_texts, key=len)
                     # 연속된 공백 정리
-                    import re
-                    content = re.sub(r'\s+', ' ', content).strip()
+                    content = ' '.join(' '.join(longest_texts).split())
 
                     if len(content) > 100:
                         logger.info(f"{source_type}에서 직접 탐색으로 본문 추출 (길이: {len(content)}자)")
-                        logger.info(f"본문 미리보기: {content[:200]}...")
 
             except Exception as e:
                 logger.warning(f"직접 탐색 중 오류: {e}")
@@ -739,8 +1230,7 @@ class NaverStockNewsCrawler:
             json_scripts = soup.find_all('script', type='application/ld+json')
             for script in json_scripts:
                 try:
-                    import json
-                    data = json.loads(script.string)
+                    data = orjson.loads(script.string or b'')
                     if isinstance(data, dict):
                         # articleBody 또는 text 필드 찾기
                         if 'articleBody' in data:
@@ -751,7 +1241,7 @@ class NaverStockNewsCrawler:
                             content = data['text']
                             logger.info(f"JSON-LD에서 텍스트 추출 성공 (길이: {len(content)}자)")
                             break
-                except:
+                except orjson.JSONDecodeError:
                     continue
 
             # 2. 메타 태그에서 description 추출
@@ -767,9 +1257,8 @@ class NaverStockNewsCrawler:
             # 3. 모든 텍스트에서 가장 긴 연속 문단 찾기
             if not content or len(content) < 50:
                 all_text = soup.get_text()
-                # 줄바꿈으로 분할하여 가장 긴 문단 찾기
-                lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-                longest_content = max(lines, key=len, default="")
+                # 줄바꿈으로 분할하여 가장 긴 문단 찾기 (중간 리스트 없이 한 번 순회)
+                longest_content = max((line.strip() for line in all_text.split('\n')), key=len, default="")
 
                 if len(longest_content) > 100:
                     content = longest_content
@@ -780,12 +1269,12 @@ class NaverStockNewsCrawler:
 
         return content
 
-    def _extract_publish_date_from_soup(self, soup: BeautifulSoup, url: str) -> str:
+    def _extract_publish_date(self, tree: LexborHTMLParser, url: str) -> str:
         """
-        BeautifulSoup 객체에��� 발행일 추출
+        selectolax 트리에서 발행일 추출 (선택자 → 메타 태그 → URL 순)
 
         Args:
-            soup: BeautifulSoup 객체
+            tree: selectolax(lexbor) 파싱 트리
             url: 원본 URL
 
         Returns:
@@ -793,104 +1282,37 @@ class NaverStockNewsCrawler:
         """
         publish_date = ""
 
-        # 1. 네이버 뉴스 특화 선택자
-        date_selectors = [
-            'span[data-date-time]',
-            'span.media_end_head_info_datestamp_time',
-            'span._ARTICLE_DATE_TIME',
-            '.media_end_head_info_datestamp_time',
-            'time[datetime]',
-            '.article_info .date',
-            '.byline .date',
-            '.news_end .date'
-        ]
-
-        for selector in date_selectors:
-            try:
-                date_elements = soup.select(selector)
-                for date_element in date_elements:
-                    # data-date-time 속성 확인
-                    date_attr = date_element.get('data-date-time')
-                    if date_attr:
-                        publish_date = date_attr
-                        logger.info(f"발행일 발견 (data-date-time): {publish_date}")
-                        break
-
-                    # datetime 속��� 확인
-                    datetime_attr = date_element.get('datetime')
-                    if datetime_attr:
-                        publish_date = datetime_attr
-                        logger.info(f"발행일 발견 (datetime): {publish_date}")
-                        break
+        # 1. 네이버 뉴스 특화 선택자 - 합친 선택자로 한 번만 순회하며 문서 순서상 첫 유효값 사용
+        for date_element in tree.css(PUBLISH_DATE_CSS):
+            attributes = date_element.attributes
+            publish_date = attributes.get('data-date-time') or attributes.get('datetime') or ""
+            if publish_date:
+                break
 
-                    # 텍스트에서 날짜 패턴 확인
-                    date_text = date_element.get_text(strip=True)
-                    if self._is_valid_date(date_text):
-                        publish_date = date_text
-                        logger.info(f"발행일 발견 (텍스트): {publish_date}")
-                        break
+            date_text = date_element.text(strip=True)
+            if _is_valid_date(date_text):
+                publish_date = date_text
+                break
 
-                if publish_date:
-                    break
-            except:
-                continue
-
-        # 2. 메타 태그에서 발행일 추출
+        # 2. 메타 태그 (같은 키는 문서상 첫 번째 값 유지, content가 빈 태그는 건너뜀)
         if not publish_date:
-            meta_selectors = [
-                'meta[property="article:published_time"]',
-                'meta[name="pubdate"]',
-                'meta[property="og:article:published_time"]',
-                'meta[name="date"]'
-            ]
-
-            for selector in meta_selectors:
-                try:
-                    meta_tag = soup.select_one(selector)
-                    if meta_tag and meta_tag.get('content'):
-                        publish_date = meta_tag['content']
-                        logger.info(f"발행일 발견 (메타태그): {publish_date}")
-                        break
-                except:
-                    continue
+            meta_lookup = {}
+            for meta_tag in (tree.head or tree.root).css('meta'):
+                attributes = meta_tag.attributes
+                key = attributes.get('property') or attributes.get('name')
+                content = attributes.get('content')
+                if key and content:
+                    meta_lookup.setdefault(key, content)
+            publish_date = next((meta_lookup[key] for key in PUBLISH_DATE_META_KEYS if key in meta_lookup), "")
 
         # 3. URL에서 날짜 추출
         if not publish_date:
-            import re
-            url_date_match = re.search(r'date=(\d{4}-?\d{2}-?\d{2})', url)
+            url_date_match = URL_DATE_RE.search(url)
             if url_date_match:
                 publish_date = url_date_match.group(1)
-                logger.info(f"발행일 발견 (URL): {publish_date}")
 
         return publish_date
 
-    def _is_valid_date(self, text: str) -> bool:
-        """
-        텍스트가 유효한 날짜 형식인지 확인
-
-        Args:
-            text: 확인할 텍스트
-
-        Returns:
-            bool: 유효한 날짜 형식인지 여부
-        """
-        import re
-
-        date_patterns = [
-            r'\d{4}[-./]\d{1,2}[-./]\d{1,2}',  # 2025-08-03
-            r'\d{1,2}[-./]\d{1,2}[-./]\d{2,4}',  # 08-03-2025
-            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',  # 2025년 8월 3일
-            r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',  # ISO 형식
-            r'\d{2}\.\d{2}\.\d{2}',  # 25.08.03
-            r'\d{4}\.\d{2}\.\d{2}',  # 2025.08.03
-        ]
-
-        for pattern in date_patterns:
-            if re.search(pattern, text):
-                return True
-
-        return False
-
     def get_today_summary(self) -> Dict:
         """
         오늘의 주요 뉴스와 리포트 요약 크롤링
@@ -908,9 +1330,10 @@ class NaverStockNewsCrawler:
         research_reports = self.get_research_reports(limit=5)
         logger.info(f"리서치 리포��� {len(research_reports)}개 수집 완료")
 
+        # 반환(직렬화) 경계에서만 dict로 변환
         return {
-            'main_news': main_news,
-            'research_reports': research_reports,
+            'main_news': [asdict(news) for news in main_news],
+            'research_reports': [asdict(report) for report in research_reports],
             'crawled_at': datetime.now().isoformat(),
             'total_count': len(main_news) + len(research_reports)
         }
@@ -923,8 +1346,17 @@ class NaverNewsHeadlineCrawler:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # HTTP/2 클라이언트: 동시 본문 크롤링 스레드들의 요청을 하나의 연결에 다중화 (스레드 간 공유 가능)
+        self.session = httpx.Client(
+            http2=True,
+            headers=self.headers,
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+
+        # 서버 부하 방지: 본문 크롤링 스레드들이 공유하는 토큰 버킷 (초당 5개, 최대 5개 누적)
+        self._rate_limiter = _TokenBucket(rate=5.0, burst=5)
 
     def get_headline_news(self, section_id: str = "101", limit: int = 20) -> List[Dict]:
         """
@@ -938,6 +1370,8 @@ class NaverNewsHeadlineCrawler:
             List[Dict]: 뉴스 정보 리스트
         """
         news_list = []
+        # 한 번의 크롤링에서 수집한 기사는 같은 수집 시각을 공유
+        now_iso = datetime.now().isoformat()
 
         try:
             # 네이버 뉴스 섹션 페이지 URL
@@ -947,70 +1381,45 @@ class NaverNewsHeadlineCrawler:
             response = self.session.get(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # 헤드라인 뉴스 선택자들
-            headline_selectors = [
-                '.section_headline .sa_text_title',  # 헤드라인 제목
-                '.section_latest .sa_text_title',    # 최신 뉴스 제목
-                '.sa_text_title',                     # 일반 뉴스 제목
-                'a[href*="/article/"]',              # 기사 링크
-            ]
-
-            news_links = []
-
-            # 헤드라인 뉴스 링크 수집
-            for selector in headline_selectors:
-                try:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        if element.name == 'a':
-                            link = element
-                        else:
-                            link = element.find_parent('a') or element.find('a')
-
-                        if link and link.get('href'):
-                            href = link.get('href')
-                            title = link.get_text(strip=True)
-
-                            # 뉴스 기사 링크인지 확인
-                            if '/article/' in href and title and len(title) > 5:
-                                full_url = href if href.startswith('http') else f"https://news.naver.com{href}"
-                                news_links.append({
-                                    'title': title,
-                                    'url': full_url
-                                })
-
-                        if len(news_links) >= limit:
-                            break
-
-                    if len(news_links) >= limit:
-                        break
+            # httpx가 Content-Type charset(기본 UTF-8)으로 디코딩한 텍스트를 전달 (meta charset 유무와 무관)
+            doc = lxml_html.fromstring(response.text)
+
+            # 헤드라인 뉴스 링크 수집 - 선택자 그룹 우선순위 순으로 조회하고 URL을 키로 수집 시점에
+            # 바로 중복 제거 (삽입 순서 유지, limit은 고유 기사 수 기준)
+            unique_by_url: Dict[str, Dict] = {}
+            for group in _XP_HEADLINE_GROUPS:
+                for element in group(doc):
+                    link = _headline_link(element)
+                    href = link.get('href') if link is not None else None
+                    if not href or '/article/' not in href:
+                        continue
+                    title = link.text_content().strip()
+
+                    # 의미있는 제목인지 확인
+                    if title and len(title) > 5:
+                        full_url = href if href.startswith('http') else f"https://news.naver.com{href}"
+                        if full_url not in unique_by_url:
+                            unique_by_url[full_url] = {
+                                'title': title,
+                                'url': full_url
+                            }
+                            if len(unique_by_url) >= limit:
+                                break
 
-                except Exception as e:
-                    logger.warning(f"선택자 '{selector}' 처리 중 오류: {e}")
-                    continue
+                if len(unique_by_url) >= limit:
+                    break
 
-            # 중복 제거 (URL 기준)
-            seen_urls = set()
-            unique_news = []
-            for news in news_links:
-                if news['url'] not in seen_urls:
-                    seen_urls.add(news['url'])
-                    unique_news.append(news)
-                    if len(unique_news) >= limit:
-                        break
+            unique_news = list(unique_by_url.values())
 
             logger.info(f"헤드라인 뉴스 {len(unique_news)}개 발견")
 
-            # 각 뉴스의 본문 내용 크롤링
-            for idx, news_item in enumerate(unique_news):
-                try:
-                    logger.info(f"뉴스 본문 크롤링 중... ({idx + 1}/{len(unique_news)})")
-
-                    # 뉴스 본문 크롤링
-                    content_data = self._get_news_content(news_item['url'])
+            # 각 뉴스의 본문 내용 동시 크롤링 (map은 입력 순서대로 결과 반환,
+            # _get_news_content는 실패 시 빈 필드를 반환하므로 본문이 없어도 기본 정보는 저장)
+            logger.info(f"뉴스 본문 크롤링 중... ({len(unique_news)}개, 스레드 {DETAIL_WORKERS}개)")
+            with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+                contents = executor.map(self._get_news_content, [news_item['url'] for news_item in unique_news])
 
+                for idx, (news_item, content_data) in enumerate(zip(unique_news, contents)):
                     news_data = {
                         'id': idx + 1,
                         'title': news_item['title'],
@@ -1020,31 +1429,11 @@ class NaverNewsHeadlineCrawler:
                         'publish_date': content_data.get('publish_date', ''),
                         'media': content_data.get('media', ''),
                         'category': f'section_{section_id}',
-                        'crawled_at': datetime.now().isoformat()
+                        'crawled_at': now_iso
                     }
 
                     news_list.append(news_data)
-                    logger.info(f"뉴스 수집 완료 ({len(news_list)}/{limit}): '{news_item['title'][:50]}...'")
-
-                    # 서버 부하 방지
-                    time.sleep(1)
-
-                except Exception as e:
-                    logger.error(f"뉴스 본문 크롤링 실패: {e}")
-                    # 본문을 가져오지 못해도 기본 정보는 저장
-                    news_data = {
-                        'id': idx + 1,
-                        'title': news_item['title'],
-                        'url': news_item['url'],
-                        'content': '',
-                        'summary': '',
-                        'publish_date': '',
-                        'media': '',
-                        'category': f'section_{section_id}',
-                        'crawled_at': datetime.now().isoformat()
-                    }
-                    news_list.append(news_data)
-                    continue
+                    logger.info("뉴스 수집 완료 (%d/%d): '%s...'", len(news_list), limit, news_item['title'][:50])
 
             logger.info(f"헤드라인 뉴스 크롤링 완료: 총 {len(news_list)}개 수집")
 
@@ -1064,144 +1453,13 @@ class NaverNewsHeadlineCrawler:
             Dict: 뉴스 본문 정보
         """
         try:
-            response = self.session.get(url, timeout=10)
+            self._rate_limiter.acquire()
+            response = self.session.get(url)
             response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # 정확한 네이버 뉴스 선택자 사용 (제공해주신 함수 참고)
-            # 1. 제목 추출
-            title = ''
-            title_selector = "#title_area > span"
-            try:
-                title_elements = soup.select(title_selector)
-                title_lst = [t.get_text(strip=True) for t in title_elements]
-                title = "".join(title_lst)
-            except:
-                pass
-
-            # 2. 발행일 추출
-            publish_date = ''
-            date_selector = "#ct > div.media_end_head.go_trans > div.media_end_head_info.nv_notrans > div.media_end_head_info_datestamp > div:nth-child(1) > span"
-            try:
-                date_elements = soup.select(date_selector)
-                date_lst = [d.get_text(strip=True) for d in date_elements]
-                publish_date = "".join(date_lst)
-            except:
-                # 대체 선택자들
-                fallback_selectors = [
-                    '.media_end_head_info_datestamp_time',
-                    'span[data-date-time]',
-                    '.author em'
-                ]
-                for selector in fallback_selectors:
-                    try:
-                        date_element = soup.select_one(selector)
-                        if date_element:
-                            publish_date = date_element.get_text(strip=True)
-                            break
-                    except:
-                        continue
-
-            # 3. 본문 내용 추출
-            content = ''
-            main_selector = "#dic_area"
-            try:
-                main_elements = soup.select(main_selector)
-                main_lst = []
-                for m in main_elements:
-                    # 불필요한 요소 제거
-                    for script in m(["script", "style", "iframe"]):
-                        script.decompose()
-
-                    # 네이버 뉴스 특화 불필요 요소 제거
-                    unwanted_selectors = [
-                        '.end_photo_org',
-                        '.media_end_head_journalist',
-                        '.media_end_summary',
-                        'strong.media_end_summary'
-                    ]
-                    for unwanted_selector in unwanted_selectors:
-                        for unwanted in m.select(unwanted_selector):
-                            unwanted.decompose()
-
-                    m_text = m.get_text(strip=True)
-                    if m_text:
-                        main_lst.append(m_text)
-
-                content = " ".join(main_lst)
-
-                # 텍스트 정리
-                import re
-                content = re.sub(r'\s+', ' ', content).strip()
-
-                # 불필요한 문구 제거
-                unwanted_phrases = [
-                    "무단전재 및 재배포 금지",
-                    "저작권자",
-                    "ⓒ",
-                    "Copyright"
-                ]
-                for phrase in unwanted_phrases:
-                    if phrase in content:
-                        content = content.split(phrase)[0].strip()
-
-            except:
-                # 대체 선택자들
-                fallback_selectors = [
-                    '#articleBodyContents',
-                    '.go_trans._article_content',
-                    '._article_body_contents'
-                ]
-                for selector in fallback_selectors:
-                    try:
-                        content_element = soup.select_one(selector)
-                        if content_element:
-                            for script in content_element(["script", "style"]):
-                                script.decompose()
-                            content = content_element.get_text(strip=True)
-                            if len(content) > 50:
-                                break
-                    except:
-                        continue
-
-            # 4. 요약 생성
-            summary = ''
-            if content:
-                sentences = content.split('.')
-                if sentences:
-                    summary = sentences[0][:200] + ('...' if len(sentences[0]) > 200 else '')
-
-            # 5. 언론사 추출
-            media = ''
-            media_selectors = [
-                '.media_end_head_top_logo img',
-                '.press_logo img',
-                '.media_end_head_top_logo_text'
-            ]
-            for selector in media_selectors:
-                try:
-                    media_element = soup.select_one(selector)
-                    if media_element:
-                        if media_element.name == 'img':
-                            media = media_element.get('alt', '')
-                        else:
-                            media = media_element.get_text(strip=True)
-                        if media:
-                            break
-                except:
-                    continue
-
-            return {
-                'content': content,
-                'summary': summary,
-                'publish_date': publish_date,
-                'media': media,
-                'title': title
-            }
-
+            return self._parse_news_content(response.content)
         except Exception as e:
-            logger.error(f"뉴스 본문 크롤링 실패 ({url}): {e}")
+            # 요청/파싱 실패 모두 빈 필드로 반환 - 한 기사의 오류가 executor.map 순회를 끊지 않도록
+            logger.error("뉴스 본문 크롤링 실패 (%s): %s", url, e)
             return {
                 'content': '',
                 'summary': '',
@@ -1210,6 +1468,91 @@ class NaverNewsHeadlineCrawler:
                 'title': ''
             }
 
+    def _parse_news_content(self, html: bytes) -> Dict:
+        """
+        뉴스 기사 HTML에서 제목/발행일/본문/요약/언론사 추출
+
+        Args:
+            html: 기사 페이지 HTML 바이트
+
+        Returns:
+            Dict: 뉴스 본문 정보
+        """
+        # selectolax(lexbor, C 파서)로 한 번만 파싱하고 모든 추출/대체 경로에서 공유
+        tree = LexborHTMLParser(html)
+
+        # 정확한 네이버 뉴스 선택자 사용 (제공해주신 함수 참고)
+        # 1. 제목 추출
+        title = "".join(t.text(strip=True) for t in tree.css(HEADLINE_TITLE_SELECTOR))
+
+        # 2. 발행일 추출
+        publish_date = "".join(d.text(strip=True) for d in tree.css(HEADLINE_DATE_SELECTOR))
+        if not publish_date:
+            # 대체 선택자들 - 같은 트리에서 처음 매치되는 선택자에서 중단
+            date_element = next(
+                (node for selector in HEADLINE_DATE_FALLBACK_SELECTORS if (node := tree.css_first(selector))),
+                None
+            )
+            if date_element:
+                publish_date = date_element.text(strip=True)
+
+        # 3. 본문 내용 추출
+        main_lst = []
+        for m in tree.css(HEADLINE_BODY_SELECTOR):
+            # 불필요한 태그 + 네이버 뉴스 특화 요소를 한 번의 순회로 제거
+            _decompose_outermost(m.css(HEADLINE_BODY_STRIP_SELECTOR))
+
+            # 텍스트 정리 - 합친 뒤 전체를 다시 훑지 않도록 요소별로 공백을 정리하며 수집
+            m_text = WHITESPACE_RE.sub(' ', m.text(strip=True)).strip()
+            if m_text:
+                main_lst.append(m_text)
+
+        content = " ".join(main_lst)
+
+        # 불필요한 문구 제거
+        phrase_match = HEADLINE_UNWANTED_PHRASE_RE.search(content)
+        if phrase_match:
+            content = content[:phrase_match.start()].rstrip()
+
+        if not content:
+            # 대체 선택자들 - 구형 기사 레이아웃, 다시 파싱하지 않고 이미 파싱한 트리 재사용
+            for selector in HEADLINE_BODY_FALLBACK_SELECTORS:
+                content_element = tree.css_first(selector)
+                if not content_element:
+                    continue
+                content_element.strip_tags(["script", "style"])
+                content = content_element.text(strip=True)
+                if len(content) > 50:
+                    break
+
+        # 4. 요약 생성 (본문이 없어도 언론사는 추출해 기본 정보로 저장)
+        summary = ''
+        if content:
+            # 첫 문장만 필요하므로 본문 전체를 split하지 않고 첫 '.'까지만 분리
+            head, _, _ = content.partition('.')
+            summary = head[:200] + ('...' if len(head) > 200 else '')
+
+        # 5. 언론사 추출
+        media = ''
+        for selector in HEADLINE_MEDIA_SELECTORS:
+            media_element = tree.css_first(selector)
+            if not media_element:
+                continue
+            if media_element.tag == 'img':
+                media = media_element.attributes.get('alt') or ''
+            else:
+                media = media_element.text(strip=True)
+            if media:
+                break
+
+        return {
+            'content': content,
+            'summary': summary,
+            'publish_date': publish_date,
+            'media': media,
+            'title': title
+        }
+
     def art_crawl(self, url: str) -> Dict:
         """
         제공해주신 art_crawl 함수 스타일로 구현한 기사 크롤링 함수
@@ -1221,53 +1564,47 @@ class NaverNewsHeadlineCrawler:
             dict: 기사제목, 날짜, 본문이 크롤링된 딕셔너리
         """
         art_dic = {}
+        now_iso = datetime.now().isoformat()
 
         try:
-            # 1. CSS 선택자 정의 (제공해주신 정확한 선택자 사용)
-            title_selector = "#title_area > span"
-            date_selector = "#ct > div.media_end_head.go_trans > div.media_end_head_info.nv_notrans > div.media_end_head_info_datestamp > div:nth-child(1) > span"
-            main_selector = "#dic_area"
-
-            # HTTP 요청
+            # 1. HTTP 요청 (CSS 선택자는 제공해주신 정확한 선택자를 모듈 상수로 사용)
             html = self.session.get(url, timeout=15)
             html.raise_for_status()
-            soup = BeautifulSoup(html.text, "lxml")
+            tree = LexborHTMLParser(html.content)
 
             # 2. 데이터 추출
             # 제목 수집
-            title = soup.select(title_selector)
-            title_lst = [t.text for t in title]
+            title = tree.css(HEADLINE_TITLE_SELECTOR)
+            title_lst = [t.text() for t in title]
             title_str = "".join(title_lst)
 
             # 날짜 수집
-            date = soup.select(date_selector)
-            date_lst = [d.text for d in date]
+            date = tree.css(HEADLINE_DATE_SELECTOR)
+            date_lst = [d.text() for d in date]
             date_str = "".join(date_lst)
 
             # 본문 수집
-            main = soup.select(main_selector)
+            main = tree.css(HEADLINE_BODY_SELECTOR)
             main_lst = []
             for m in main:
                 # 불필요한 요소 제거
-                for script in m(["script", "style", "iframe"]):
-                    script.decompose()
+                m.strip_tags(["script", "style", "iframe"])
 
-                m_text = m.text
+                m_text = m.text()
                 m_text = m_text.strip()
                 if m_text:
                     main_lst.append(m_text)
             main_str = "".join(main_lst)
 
             # 텍스트 정리
-            import re
-            main_str = re.sub(r'\s+', ' ', main_str).strip()
+            main_str = WHITESPACE_RE.sub(' ', main_str).strip()
 
             # 3. 결과 딕셔너리 구성
             art_dic["title"] = title_str
             art_dic["date"] = date_str
             art_dic["main"] = main_str
             art_dic["url"] = url
-            art_dic["crawled_at"] = datetime.now().isoformat()
+            art_dic["crawled_at"] = now_iso
 
             logger.info(f"art_crawl 완료 - 제목: '{title_str[:50]}...', 본문: {len(main_str)}자")
 
@@ -1278,7 +1615,7 @@ class NaverNewsHeadlineCrawler:
                 "date": "",
                 "main": "",
                 "url": url,
-                "crawled_at": datetime.now().isoformat()
+                "crawled_at": now_iso
             }
 
         return art_dic
@@ -1299,15 +1636,16 @@ class NaverNewsHeadlineCrawler:
             filename = f"naver_news_headlines_{timestamp}.json"
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump({
+            # orjson은 UTF-8 바이트를 바로 생성하므로 바이너리 모드로 기록
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps({
                     'metadata': {
                         'total_count': len(news_list),
                         'crawled_at': datetime.now().isoformat(),
                         'source': 'naver_news_headlines'
                     },
                     'news': news_list
-                }, f, ensure_ascii=False, indent=2)
+                }, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
             logger.info(f"뉴스 데이터 JSON 파일 저장 완료: {filename}")
             return filename
@@ -0,0 +1,37 @@
+"""
+news_analyzer 카테고리 인사이트 집계 테스트 (pytest)
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_analyzer import _compute_category_insights
+
+
+def test_most_active_category_tie_keeps_first_inserted():
+    """건수가 같으면 먼저 등장한 카테고리를 최다 카테고리로 선택"""
+    reports_key = (
+        ('A', '가증권', '제목1'),
+        ('B', '나증권', '제목2'),
+        ('B', '다증권', '제목3'),
+        ('A', '라증권', '제목4'),
+    )
+    formatted_stats, most_active_category = _compute_category_insights(reports_key)
+
+    assert most_active_category == 'A'
+    assert formatted_stats['A']['count'] == 2
+    assert formatted_stats['B']['count'] == 2
+
+
+def test_most_active_category_highest_count():
+    """건수가 가장 많은 카테고리 선택"""
+    reports_key = (
+        ('A', None, '제목1'),
+        ('B', None, '제목2'),
+        ('B', None, '제목3'),
+    )
+    _, most_active_category = _compute_category_insights(reports_key)
+
+    assert most_active_category == 'B'